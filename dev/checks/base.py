@@ -1,10 +1,16 @@
 import abc
-from typing import Any, Dict, List, Optional, Mapping, Union, Callable, ClassVar
+from typing import Any, Dict, List, Optional, Mapping, Union, Callable, ClassVar, Set
 from dataclasses import dataclass, field
+from functools import lru_cache
+from hashlib import blake2b, md5
 from pathlib import Path
 import enum
+import os
+import pickle
+import sys
 import uuid
 
+from dev.caching import get_cashier_instance
 from dev.intrangeset import IntRangeSet
 
 
@@ -115,13 +121,12 @@ class IssueList:
         Adds an issue to the list.
         """
         if self.issues:
-            if self.issues[-1] == issue:
-                return
-            if (
-                self.issues[-1].issue_type == issue.issue_type
-                and self.issues[-1].data == issue.data
-            ):
-                self.issues[-1].location = self.issues[-1].location + issue.location
+            last = self.issues[-1]
+            # Compare the cheap fields first; most consecutive issues differ
+            if last.issue_type == issue.issue_type and last.data == issue.data:
+                if last.location == issue.location and last.fix == issue.fix:
+                    return
+                last.location = last.location + issue.location
                 return
         self.issues.append(issue)
 
@@ -192,3 +197,101 @@ class DirectoryCheck(abc.ABC):
     @abc.abstractmethod
     def check(self, path: Path, ctx: FileContext = FileContext()) -> List[Issue]:
         raise NotImplementedError()
+
+
+@lru_cache(maxsize=None)
+def _module_digest(module_name: str) -> str:
+    """
+    Hash of a module's source, so cached results are dropped when the check
+    implementation changes.
+    """
+    try:
+        with open(sys.modules[module_name].__file__, "rb") as f:
+            return md5(f.read()).hexdigest()
+    except (AttributeError, KeyError, OSError, TypeError):
+        return ""
+
+
+def _content_digest(content: bytes) -> str:
+    """Hashes a file's content for use in a cache key."""
+    return blake2b(content, digest_size=16).hexdigest()
+
+
+class CachedFileCheck(FileCheck):
+    """
+    A FileCheck whose results are cached in ``.dev.cache.db``, keyed by the
+    file's content, path and context and by the check's configuration, so
+    unchanged files are not scanned again on later runs.
+
+    Set ``DEV_NO_CACHE=1`` to bypass the cache.
+    """
+
+    cache_path: ClassVar[str] = ".dev.cache.db"
+    # Entries of a check older than this are dropped when new ones are stored
+    cache_max_age: ClassVar[float] = 30 * 24 * 3600
+    # Checks whose old entries were already dropped by this process
+    _pruned: ClassVar[Set[str]] = set()
+
+    def _config_fingerprint(self) -> str:
+        """
+        Returns a stable description of everything (besides the file) the
+        results depend on. Subclasses with configuration must override this.
+        """
+        return ""
+
+    def _cached(
+        self,
+        path: Path,
+        content: bytes,
+        ctx: Optional["FileContext"],
+        compute: Callable[[], List[Issue]],
+        extra_key: Any = None,
+    ) -> List[Issue]:
+        """
+        Returns the cached issues for path with the given content, or calls
+        compute and caches its result. Results that cannot be pickled (e.g.
+        with fixes that are closures) are simply not cached.
+
+        content is the file's content as already read by the check, so the
+        file is not opened again just to hash it. extra_key holds any other
+        input compute depends on (e.g. the expected file properties); its
+        repr becomes part of the key.
+        """
+        if os.environ.get("DEV_NO_CACHE") == "1":
+            return compute()
+
+        cls = type(self)
+        fqn = f"{cls.__module__}.{cls.__qualname__}"
+        key = md5(
+            repr(
+                (
+                    fqn,
+                    _module_digest(cls.__module__),
+                    self._config_fingerprint(),
+                    str(path),
+                    ctx,
+                    extra_key,
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+        key = f"{key}:{_content_digest(content)}"
+
+        try:
+            cashier = get_cashier_instance(self.cache_path)
+            cached = cashier.get(key)
+        except Exception:
+            cashier, cached = None, None
+        if cached is not None:
+            return cached
+
+        issues = compute()
+        if cashier is not None:
+            # Expired entries are dropped with the first write of each run
+            # only, so later writes are a single insert
+            max_age = None if fqn in self._pruned else self.cache_max_age
+            try:
+                cashier.set(key, fqn, pickle.dumps(issues, protocol=4), max_age=max_age)
+                self._pruned.add(fqn)
+            except Exception:
+                pass
+        return issues
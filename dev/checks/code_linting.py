@@ -6,12 +6,18 @@
 from __future__ import annotations
 
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from dev.checks.base import FileCheck, IssueType, IssueList, FileContext
 from dev.messages import info, error
 
+try:
+    import black
+except ImportError:
+    black = None
+
 
 E_BLACK_MISSING = IssueType(
     "110a3061-88e1-4ddc-8873-cb2c34657c6d",
@@ -64,6 +70,24 @@ E_CS_NOT_FORMATTED = IssueType(
 )
 
 
+@lru_cache(maxsize=None)
+def _black_mode(pyproject: Optional[str]) -> "black.Mode":
+    """
+    Builds the ``black`` mode from ``[tool.black]`` in the given
+    pyproject.toml, mirroring what the CLI would pick up.
+    """
+    config = black.parse_pyproject_toml(pyproject) if pyproject else {}
+    return black.Mode(
+        target_versions={
+            black.TargetVersion[v.upper()] for v in config.get("target_version", [])
+        },
+        line_length=config.get("line_length", black.DEFAULT_LINE_LENGTH),
+        string_normalization=not config.get("skip_string_normalization"),
+        magic_trailing_comma=not config.get("skip_magic_trailing_comma"),
+        preview=bool(config.get("preview")),
+    )
+
+
 class PythonFormattingCheck(FileCheck):
     """Check Python source files with ``black``."""
 
@@ -73,23 +97,36 @@ class PythonFormattingCheck(FileCheck):
 
         issues = IssueList()
 
+        def fix():
+            try:
+                subprocess.run(
+                    ["black", "--quiet", str(path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except Exception as e:
+                error(f"Failed to format {path}: {e}")
+
+        if black is not None:
+            # Format in-process rather than paying for a ``black`` process per file.
+            mode = _black_mode(black.find_pyproject_toml((str(path),)))
+            try:
+                black.format_file_contents(
+                    path.read_text(encoding="utf-8"), fast=True, mode=mode
+                )
+            except black.NothingChanged:
+                return []
+            except (black.InvalidInput, UnicodeDecodeError):
+                return []
+            issues.append(E_NOT_FORMATTED.at(path).fixable(fix))
+            return issues.issues
+
         try:
             result = subprocess.run(
                 ["black", "--check", "--quiet", str(path)],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-
-            def fix():
-                try:
-                    subprocess.run(
-                        ["black", str(path)],
-                        capture_output=True,
-                        text=True,
-                    )
-                except Exception as e:
-                    error(f"Failed to format {path}: {e}")
-
             if result.returncode != 0:
                 issues.append(E_NOT_FORMATTED.at(path).fixable(fix))
         except FileNotFoundError:
@@ -109,8 +146,8 @@ class KotlinFormattingCheck(FileCheck):
         try:
             result = subprocess.run(
                 ["ktlint", str(path)],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             if result.returncode != 0:
                 issues.append(E_KOTLIN_NOT_FORMATTED.at(path))
@@ -131,8 +168,8 @@ class CppFormattingCheck(FileCheck):
         try:
             result = subprocess.run(
                 ["clang-format", "--dry-run", "--Werror", str(path)],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             if result.returncode != 0:
                 issues.append(E_CPP_NOT_FORMATTED.at(path))
@@ -153,8 +190,8 @@ class PurescriptFormattingCheck(FileCheck):
         try:
             result = subprocess.run(
                 ["purs-tidy", "format", "--check", str(path)],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             if result.returncode != 0:
                 issues.append(E_PURESCRIPT_NOT_FORMATTED.at(path))
@@ -175,8 +212,8 @@ class CSharpFormattingCheck(FileCheck):
         try:
             result = subprocess.run(
                 ["csharpier", "--check", str(path)],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             if result.returncode != 0:
                 issues.append(E_CS_NOT_FORMATTED.at(path))
@@ -14,70 +14,73 @@ import sys  # Added for stderr
 # --- Helper Functions ---
 
 
-def has_shebang(filepath):
+# Mach-O "magic" values, including fat/universal binaries.
+MACH_O_SIGNATURES = frozenset(
+    {
+        b"\xfe\xed\xfa\xce",  # 0xFEEDFACE  (32-bit big-endian)
+        b"\xce\xfa\xed\xfe",  # 0xCEFAEDFE  (32-bit little-endian)
+        b"\xfe\xed\xfa\xcf",  # 0xFEEDFACF  (64-bit big-endian)
+        b"\xcf\xfa\xed\xfe",  # 0xCFFAEDFE  (64-bit little-endian)
+        b"\xca\xfe\xba\xbe",  # Fat/universal binaries
+        b"\xbe\xba\xfe\xca",
+    }
+)
+
+# O_NOATIME / O_NOFOLLOW are not available on every platform.
+_PROBE_FLAGS = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0)
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _probe_magic(filepath):
     """
-    Checks if a file starts with a shebang ('#!').
-    Returns False if the file can't be read or is empty.
+    Returns the first 4 bytes of a file using a raw, unbuffered read.
+
+    Symlinks are not followed and, where supported, the access time is not
+    updated. Returns b"" if the file can't be read.
     """
     try:
-        with open(filepath, "rb") as f:
-            return f.read(2) == b"#!"
-    except (IOError, OSError):
-        # print(f"Warning: Could not read {filepath} to check for shebang.", file=sys.stderr)
-        return False
-    except Exception as e:
-        # print(f"Warning: Error reading {filepath}: {e}", file=sys.stderr)
-        return False
+        try:
+            fd = os.open(filepath, _PROBE_FLAGS | _O_NOATIME)
+        except PermissionError:
+            # O_NOATIME is only permitted for the file owner.
+            if not _O_NOATIME:
+                raise
+            fd = os.open(filepath, _PROBE_FLAGS)
+        try:
+            return os.read(fd, 4)
+        finally:
+            os.close(fd)
+    except OSError:
+        return b""
 
 
-def is_elf_exe_mach(filepath):
+def classify(filepath):
     """
-    Checks if a file is an ELF, a Windows EXE, or a Mach-O (Darwin) executable
-    by examining the first few bytes (the file "magic numbers").
+    Classifies a file by its leading "magic" bytes.
 
-    Returns a string among {"elf", "exe", "mach-o"} if recognized,
-    or None if it does not match these known file types.
+    Returns one of {"shebang", "elf", "exe", "mach-o"} if recognized,
+    or None if the file can't be read or does not match these known types.
     """
-    try:
-        with open(filepath, "rb") as f:
-            # Read first 4 bytes
-            magic = f.read(4)
-
-        # -- Check ELF --
-        # ELF files start with 0x7F, 'E', 'L', 'F'
-        if magic == b"\x7fELF":
-            return "elf"
-
-        # -- Check Windows EXE (PE) --
-        # Windows EXEs normally start with 'MZ' (0x4D, 0x5A)
-        # Usually followed by other header bytes, but 'MZ' is the key signature
-        if magic.startswith(b"MZ"):
-            return "exe"
-
-        # -- Check Mach-O (Darwin) --
-        # 32-bit Mach-O: 0xFEEDFACE (little-endian: 0xCEFAEDFE)
-        # 64-bit Mach-O: 0xFEEDFACF (little-endian: 0xCFFAEDFE)
-        # On arm64 Macs, you’ll typically see the 64-bit Mach-O magic (0xFEEDFACF).
-        # We can check for any known Mach-O “magic” or “fat” magic.
-        mach_o_signatures = {
-            b"\xfe\xed\xfa\xce",  # 0xFEEDFACE  (32-bit big-endian)
-            b"\xce\xfa\xed\xfe",  # 0xCEFAEDFE  (32-bit little-endian)
-            b"\xfe\xed\xfa\xcf",  # 0xFEEDFACF  (64-bit big-endian)
-            b"\xcf\xfa\xed\xfe",  # 0xCFFAEDFE  (64-bit little-endian)
-            b"\xca\xfe\xba\xbe",  # Fat/universal binaries
-            b"\xbe\xba\xfe\xca",
-        }
-        if magic in mach_o_signatures:
-            return "mach-o"
-
-        return None
-    except (IOError, OSError):
-        return None
-    except Exception:
-        return None
-
-
-assert is_elf_exe_mach("trufflehog")
+    magic = _probe_magic(filepath)
+
+    # Scripts start with '#!'
+    if magic.startswith(b"#!"):
+        return "shebang"
+
+    # ELF files start with 0x7F, 'E', 'L', 'F'
+    if magic == b"\x7fELF":
+        return "elf"
+
+    # Windows EXEs normally start with 'MZ' (0x4D, 0x5A)
+    # Usually followed by other header bytes, but 'MZ' is the key signature
+    if magic.startswith(b"MZ"):
+        return "exe"
+
+    # On arm64 Macs, you’ll typically see the 64-bit Mach-O magic (0xFEEDFACF).
+    if magic in MACH_O_SIGNATURES:
+        return "mach-o"
+
+    return None
 
 
 def is_executable(filepath):
@@ -164,8 +167,7 @@ def find_and_process_files(root_dir, fix_files=False):
                         # Check if extension is non-executable and file lacks shebang
                         # (filename in NON_EXECUTABLE_EXTENSIONS or ext_lower in NON_EXECUTABLE_EXTENSIONS) and
                         if not (
-                            has_shebang(filepath)
-                            or is_elf_exe_mach(filepath) is not None
+                            classify(filepath) is not None
                             or ext_lower in EXECUTABLE_EXTENSIONS
                         ):
                             suspicious_files_found.append(filepath)
@@ -180,7 +182,7 @@ def find_and_process_files(root_dir, fix_files=False):
                                 else:
                                     error_count += 1
                         # Optional: Check for executable files with NO extension and no shebang
-                        # elif not ext and not has_shebang(filepath):
+                        # elif not ext and classify(filepath) != "shebang":
                         #     suspicious_files_found.append(filepath)
                         #     print(f"Suspicious: {filepath} (No Extension, Executable, No Shebang)")
                         #     if fix_files:
@@ -29,8 +29,19 @@ import re
 import os
 import platform
 import unicodedata
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Optional, Dict, Pattern
+from typing import (
+    List,
+    Set,
+    Optional,
+    Dict,
+    DefaultDict,
+    Pattern,
+    FrozenSet,
+    Tuple,
+)
 
 # Import necessary components from your base framework
 # (Adjust the import path if necessary)
@@ -39,13 +50,16 @@ from dev.checks.base import (
     DirectoryCheck,
     Issue,
     IssueType,
-    Severity,
     FileLocation,
     IntRangeSet,
     FileContext,
     IssueList,
 )
 
+# Shared default context for checks called without one. FileContext is a
+# frozen dataclass, so a single instance can safely be reused everywhere.
+_EMPTY_CTX = FileContext()
+
 # --- Configuration Defaults ---
 
 # Reasonable max filename length, adjust as needed
@@ -83,30 +97,32 @@ DEFAULT_SENSITIVE_FILENAME_PATTERNS: Set[str] = {
 DEFAULT_PROBLEMATIC_FILENAME_CHARS: Set[str] = set("*?:[]$&;|<>!`\"'()")
 
 # Windows reserved filenames (case-insensitive, without extension)
-WINDOWS_RESERVED_NAMES: Set[str] = {
-    "CON",
-    "PRN",
-    "AUX",
-    "NUL",
-    "COM1",
-    "COM2",
-    "COM3",
-    "COM4",
-    "COM5",
-    "COM6",
-    "COM7",
-    "COM8",
-    "COM9",
-    "LPT1",
-    "LPT2",
-    "LPT3",
-    "LPT4",
-    "LPT5",
-    "LPT6",
-    "LPT7",
-    "LPT8",
-    "LPT9",
-}
+WINDOWS_RESERVED_NAMES: FrozenSet[str] = frozenset(
+    {
+        "CON",
+        "PRN",
+        "AUX",
+        "NUL",
+        "COM1",
+        "COM2",
+        "COM3",
+        "COM4",
+        "COM5",
+        "COM6",
+        "COM7",
+        "COM8",
+        "COM9",
+        "LPT1",
+        "LPT2",
+        "LPT3",
+        "LPT4",
+        "LPT5",
+        "LPT6",
+        "LPT7",
+        "LPT8",
+        "LPT9",
+    }
+)
 
 # --- Issue Types ---
 
@@ -146,6 +162,14 @@ E_SYMLINK_BROKEN = IssueType(
     "40fe9df5-cfa0-43cf-8fb0-15115ddced28",
     "Symbolic link '{link_name}' points to a non-existent target '{target}'.",
 )
+E_SYMLINK_READ_ERROR = IssueType(
+    "0124f823-fd94-47d0-83bc-30dd019e823f",
+    "Could not read symbolic link '{link_name}': {error}.",
+)
+E_DIRECTORY_LIST_ERROR = IssueType(
+    "7b505a11-2302-4ba6-9efa-98b3d28f50e2",
+    "Could not list directory '{directory}': {error}.",
+)
 E_SYMLINK = IssueType(
     "a53bf5c2-e650-47c8-b360-3bf4d8fee646",
     "Symbolic links are not allowed in repositories due to Windows issues.",
@@ -180,41 +204,102 @@ class SensitiveFilenameCheck(FileCheck):
     def __init__(
         self, sensitive_patterns: Set[str] = DEFAULT_SENSITIVE_FILENAME_PATTERNS
     ):
-        # Store lowercase patterns for case-insensitive matching
-        self.sensitive_patterns_lower = {p.lower() for p in sensitive_patterns}
+        # Store lowercase patterns for case-insensitive matching. Exact filename
+        # hits are a hash lookup; only the remaining names are scanned.
+        self.sensitive_patterns_lower = frozenset(p.lower() for p in sensitive_patterns)
+        self._substr = tuple(
+            sorted(self.sensitive_patterns_lower, key=len, reverse=True)
+        )
+        # Extension-like patterns (e.g. ".bak") also match as a plain suffix,
+        # which the delimiter rule below misses for names like "notes.bak".
+        self._suffixes = tuple(p for p in self._substr if p.startswith("."))
+        # All patterns are found in one pass of a single alternation regex.
+        # Requiring a delimiter ("._-/") avoids '.bak' matching 'playback.txt';
+        # lookarounds keep a delimiter shared by adjacent patterns available to both.
+        self._combined = re.compile(
+            r"(?:^|(?<=[\._\-/]))("
+            + "|".join(re.escape(p) for p in self._substr)
+            + r")(?=$|[\._\-/])"
+        )
+
+    def _find_patterns(self, filename_lower: str) -> List[str]:
+        """
+        Returns the patterns found in the filename: extension-like patterns
+        ending the name, and any pattern delimited by common separators or
+        the start/end of the name.
+        """
+        found: List[str] = []
+        if self._suffixes and filename_lower.endswith(self._suffixes):
+            found.append(next(s for s in self._suffixes if filename_lower.endswith(s)))
+
+        if not self._substr:
+            return found
+        for m in self._combined.finditer(filename_lower):
+            if m.group(1) not in found:
+                found.append(m.group(1))
+        return found
 
     def check(self, path: Path, ctx: FileContext) -> List[Issue]:
         issues = IssueList()
-        filename_lower = path.name.lower()
+        filename = path.name
+        filename_lower = filename.lower()
 
         # Check for exact matches first (e.g., ".env")
         if filename_lower in self.sensitive_patterns_lower:
             issues.append(
                 E_SENSITIVE_FILENAME.make(
-                    filename=path.name, pattern=filename_lower  # The matched pattern
+                    filename=filename, pattern=filename_lower  # The matched pattern
                 ).at(path)
             )
             return issues.issues  # Report once per file if exact match found
 
         # Check for substring matches (e.g., "my_private_key.pem")
-        for pattern in self.sensitive_patterns_lower:
-            # Avoid overly broad matches like '.bak' matching 'playback.txt'
-            # Check if filename contains pattern delimited by common separators or start/end
-            # This is a heuristic, might need refinement based on common patterns
-            if re.search(
-                rf"(?:^|[\._\-/]){re.escape(pattern)}(?:$|[\._\-/])", filename_lower
-            ):
-                issues.append(
-                    E_SENSITIVE_FILENAME.make(filename=path.name, pattern=pattern).at(
-                        path
-                    )
-                )
-                # Optionally break after first match per file:
-                # break
+        for pattern in self._find_patterns(filename_lower):
+            issues.append(
+                E_SENSITIVE_FILENAME.make(filename=filename, pattern=pattern).at(path)
+            )
 
         return issues.issues
 
 
+@lru_cache(maxsize=32)
+def _compile_name_scan(problematic_chars: FrozenSet[str]) -> Pattern:
+    """
+    Compiles the pattern finding problematic characters (including ASCII
+    control characters) in group 1 and non-ASCII characters in group 2.
+    """
+    return re.compile(
+        r"([\x00-\x1f"
+        + re.escape("".join(sorted(problematic_chars)))
+        + r"])|([^\x00-\x7f])"
+    )
+
+
+# Many files share a basename (__init__.py, README.md, ...), so the
+# properties of each distinct name are computed once.
+@lru_cache(maxsize=8192)
+def _check_filename(
+    filename: str, name_scan: Pattern
+) -> Tuple[FrozenSet[str], bool, bool]:
+    """
+    Returns the problematic characters in the name, whether it is non-ASCII,
+    and whether it is a Windows reserved name. Depends only on the name and
+    the compiled pattern.
+    """
+    found_problematic: Set[str] = set()
+    non_ascii = False
+    for match in name_scan.finditer(filename):
+        if match.group(1):
+            found_problematic.add(match.group(1))
+        else:
+            non_ascii = True
+    # Reserved names stay reserved with any extension ("nul.txt")
+    dot = filename.find(".")
+    stem = filename if dot < 0 else filename[:dot]
+    reserved = stem.upper() in WINDOWS_RESERVED_NAMES
+    return frozenset(found_problematic), non_ascii, reserved
+
+
 class FilenamePropertiesCheck(FileCheck):
     """
     Checks filenames for various potentially problematic properties:
@@ -232,44 +317,36 @@ class FilenamePropertiesCheck(FileCheck):
         check_leading_trailing: bool = True,  # Check leading/trailing by default
     ):
         self.problematic_chars = problematic_chars
+        self._name_scan = _compile_name_scan(frozenset(problematic_chars))
         self.check_non_ascii = check_non_ascii
         self.check_reserved = check_reserved
         self.check_leading_trailing = check_leading_trailing
-        # Compile reserved names check (case-insensitive)
-        self.reserved_pattern = (
-            re.compile(
-                r"^("
-                + "|".join(re.escape(name) for name in WINDOWS_RESERVED_NAMES)
-                + r")(\..*)?$",
-                re.IGNORECASE,
-            )
-            if self.check_reserved
-            else None
-        )
 
-    def check(self, path: Path, ctx: FileContext = FileContext()) -> List[Issue]:
+    def check(self, path: Path, ctx: FileContext = _EMPTY_CTX) -> List[Issue]:
         issues = IssueList()
         filename = path.name
+        found_problematic, non_ascii, reserved = _check_filename(
+            filename, self._name_scan
+        )
+        non_ascii = non_ascii and self.check_non_ascii
+        reserved = reserved and self.check_reserved
 
         # 1. Check for problematic characters
-        found_problematic = {
-            char for char in filename if char in self.problematic_chars
-        }
         if found_problematic:
             issues.append(
                 E_PROBLEMATIC_FILENAME_CHARS.make(
-                    filename=filename, chars=", ".join(sorted(list(found_problematic)))
+                    filename=filename, chars=", ".join(sorted(found_problematic))
                 ).at(path)
             )
 
         # 2. Check for non-ASCII characters
-        if self.check_non_ascii and not filename.isascii():
+        if non_ascii:
             # Check if it's just Unicode normalization differences (less critical)
             # This is complex; for now, just flag any non-ASCII
             issues.append(E_NON_ASCII_FILENAME.make(filename=filename).at(path))
 
         # 3. Check for Windows reserved names
-        if self.reserved_pattern and self.reserved_pattern.match(filename):
+        if reserved:
             issues.append(E_RESERVED_FILENAME.make(filename=filename).at(path))
 
         return issues.issues
@@ -304,7 +381,7 @@ class NamingConventionCheck(FileCheck):
         """
         self.conventions = conventions if conventions else {}
 
-    def check(self, path: Path, ctx: FileContext = FileContext()) -> List[Issue]:
+    def check(self, path: Path, ctx: FileContext = _EMPTY_CTX) -> List[Issue]:
         issues = IssueList()
         filename_stem = path.stem  # Filename without extension
         extension = path.suffix.lower()
@@ -330,6 +407,42 @@ class NamingConventionCheck(FileCheck):
         return issues.issues
 
 
+def _check_symlink_target(
+    link: str, check_absolute: bool = True, check_broken: bool = True
+) -> List[Issue]:
+    """Checks a path already known to be a symbolic link."""
+    issues = IssueList()
+    name = os.path.basename(link)
+    try:
+        target_path_str = os.readlink(link)  # Read link target as string
+    except OSError as e:
+        # Handle potential errors reading the link itself
+        issues.append(
+            E_SYMLINK_READ_ERROR.make(link_name=name, error=str(e)).at(Path(link))
+        )
+        return issues.issues
+
+    # 1. Check if target is absolute
+    if check_absolute and os.path.isabs(target_path_str):
+        issues.append(
+            E_SYMLINK_POINTS_ABSOLUTE.make(link_name=name, target=target_path_str).at(
+                Path(link)
+            )
+        )
+
+    # 2. Check if target exists (relative to the link's location)
+    # lexists checks the immediate target without following it further;
+    # joining onto an absolute target yields the target itself.
+    if check_broken and not os.path.lexists(
+        os.path.join(os.path.dirname(link), target_path_str)
+    ):
+        issues.append(
+            E_SYMLINK_BROKEN.make(link_name=name, target=target_path_str).at(Path(link))
+        )
+
+    return issues.issues
+
+
 class SymlinkTargetCheck(FileCheck):
     """Checks symbolic links for absolute paths or broken targets."""
 
@@ -337,72 +450,12 @@ class SymlinkTargetCheck(FileCheck):
         self.check_absolute = check_absolute
         self.check_broken = check_broken
 
-    def check(self, path: Path, ctx: FileContext = FileContext()) -> List[Issue]:
-        issues = IssueList()
+    def check(self, path: Path, ctx: FileContext = _EMPTY_CTX) -> List[Issue]:
         if not path.is_symlink():
             return []
-
-        try:
-            target_path_str = os.readlink(str(path))  # Read link target as string
-            target_path = Path(target_path_str)  # Convert to Path
-
-            # 1. Check if target is absolute
-            if self.check_absolute and target_path.is_absolute():
-                issues.append(
-                    E_SYMLINK_POINTS_ABSOLUTE.make(
-                        link_name=path.name, target=target_path_str
-                    ).at(path)
-                )
-
-            # 2. Check if target exists (relative to the link's location)
-            # Note: resolve() can fail if the link is broken deeper in the chain
-            # exists() checks if the immediate target resolves correctly
-            if self.check_broken:
-                # Use os.path.exists which handles links correctly without full resolve
-                # Construct the absolute path to the target based on the link's dir
-                absolute_target = os.path.abspath(
-                    os.path.join(os.path.dirname(str(path)), target_path_str)
-                )
-                if not os.path.lexists(
-                    absolute_target
-                ):  # lexists checks link target without following
-                    issues.append(
-                        E_SYMLINK_BROKEN.make(
-                            link_name=path.name, target=target_path_str
-                        ).at(path)
-                    )
-                # More robust check: Check if path.resolve() works without error AND exists
-                # try:
-                #     resolved_target = path.resolve(strict=True) # strict=True raises error if broken
-                #     if not resolved_target.exists(): # Double check after resolving
-                #          # This case is less likely if strict=True works, but belt-and-suspenders
-                #          issues.append(W_SYMLINK_BROKEN.make(link_name=path.name, target=target_path_str).at(path))
-                # except (FileNotFoundError, RuntimeError): # RuntimeError on Windows for certain broken links
-                #     issues.append(W_SYMLINK_BROKEN.make(link_name=path.name, target=target_path_str).at(path))
-
-        except OSError as e:
-            # Handle potential errors reading the link itself
-            issues.append(
-                Issue(
-                    IssueType(
-                        "symlink-read-error",
-                        f"Could not read symbolic link '{path.name}': {e}",
-                        Severity.ERROR,
-                    )
-                ).at(path)
-            )
-        except Exception as e:  # Catch unexpected errors
-            issues.append(
-                Issue(
-                    IssueType(
-                        "symlink-generic-error",
-                        f"Unexpected error checking symbolic link '{path.name}': {e}",
-                        Severity.ERROR,
-                    )
-                ).at(path)
-            )
-
-        return issues.issues
+        return _check_symlink_target(
+            os.fspath(path), self.check_absolute, self.check_broken
+        )
 
 
 # --- DirectoryCheck Implementation ---
@@ -413,31 +466,23 @@ class CaseConflictCheck(DirectoryCheck):
     Checks for files within the same directory whose names differ only by case.
     """
 
-    def check(self, path: Path, ctx: FileContext = FileContext()) -> List[Issue]:
+    def check(self, path: Path, ctx: FileContext = _EMPTY_CTX) -> List[Issue]:
         issues = IssueList()
         if not path.is_dir():
             return []  # Should not happen if called correctly, but check anyway
 
-        filenames_lower_map: Dict[str, List[str]] = {}
+        filenames_lower_map: DefaultDict[str, List[str]] = defaultdict(list)
         try:
-            for item in path.iterdir():
-                # Optional: Only check files, or check both files and dirs? Checking both seems safer.
-                # if item.is_file():
-                name = item.name
-                name_lower = name.lower()
-                if name_lower not in filenames_lower_map:
-                    filenames_lower_map[name_lower] = []
-                filenames_lower_map[name_lower].append(name)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Optional: Only check files, or check both files and dirs? Checking both seems safer.
+                    # if entry.is_file():
+                    filenames_lower_map[entry.name.lower()].append(entry.name)
         except OSError as e:
+            # Associate error with the directory itself
             issues.append(
-                Issue(
-                    IssueType(
-                        "dir-list-error",
-                        f"Could not list directory '{path}': {e}",
-                        Severity.ERROR,
-                    )
-                ).at(path)
-            )  # Associate error with the directory itself
+                E_DIRECTORY_LIST_ERROR.make(directory=str(path), error=str(e)).at(path)
+            )
             return issues.issues
 
         for name_lower, original_names in filenames_lower_map.items():
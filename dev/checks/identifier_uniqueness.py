@@ -4,7 +4,10 @@
 
 import re
 import abc
-from typing import List, Dict, Tuple, Set, Optional, Any
+import bisect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Set, Optional, Any, Iterator
 from pathlib import Path
 
 # Import necessary components from your new system
@@ -42,6 +45,20 @@ ULID_CROCKFORD_CHARS = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
 # Match "01" followed by 24 Crockford Base32 characters
 ULID_PATTERN = re.compile(rf"(\"01[{ULID_CROCKFORD_CHARS}]{{24}}\")")
 
+# Byte-level versions of the above. Identifiers are ASCII, so files are scanned
+# without decoding them.
+UUID_PATTERN_B = re.compile(UUID_PATTERN.pattern.encode("ascii"))
+ULID_PATTERN_B = re.compile(ULID_PATTERN.pattern.encode("ascii"))
+# Both in a single pass; the patterns are disjoint, and match.lastgroup names
+# the kind of identifier found.
+IDENTIFIER_PATTERN_B = re.compile(
+    rb"(?P<uuid>"
+    + UUID_PATTERN_B.pattern
+    + rb")|(?P<ulid>"
+    + ULID_PATTERN_B.pattern
+    + rb")"
+)
+
 # Combine source file extensions (can be refined based on project needs)
 # Using a frozenset for immutability and slightly faster lookups
 SOURCE_FILE_EXTENSIONS = frozenset(
@@ -90,6 +107,10 @@ SOURCE_FILE_EXTENSIONS = frozenset(
         ".php7",
     ]
 )
+# The same extensions as a tuple for str.endswith, which tests them all in a
+# single call. Every extension has exactly one dot, so a suffix match is the
+# same as comparing the text after the last dot.
+_EXT_TUPLE = tuple(sorted(SOURCE_FILE_EXTENSIONS, key=len, reverse=True))
 
 # Consider standard ignore patterns if your framework supports them (e.g., .gitignore)
 # For simplicity, replicating basic ignore logic if needed.
@@ -103,6 +124,54 @@ DEFAULT_IGNORE_DIRS: Set[str] = {
 }
 DEFAULT_IGNORE_FILES: Set[str] = {".DS_Store", "Thumbs.db", "desktop.ini"}
 
+# Below this many candidate files, scanning in-process beats starting workers.
+PARALLEL_SCAN_MIN_FILES = 256
+
+# --- Helpers ---
+
+
+def _newline_offsets(data: bytes) -> List[int]:
+    """
+    Returns the offsets of all newlines in data, preceded by -1, so that
+    bisect_right(offsets, i) is the 1-based line number of offset i.
+    """
+    offsets = [-1]
+    i = data.find(b"\n")
+    while i >= 0:
+        offsets.append(i)
+        i = data.find(b"\n", i + 1)
+    return offsets
+
+
+def _scan_one(file_name: str) -> List[Tuple[str, bytes, int]]:
+    """
+    Returns (kind, value, line number) for every identifier in the file.
+    A top-level function so it can be sent to worker processes.
+    """
+    # Identifiers never span lines, so scan the whole file at once and
+    # only work out line numbers for the (rare) matches.
+    try:
+        with open(file_name, "rb") as f:
+            data = f.read()
+    except OSError:
+        return []  # e.g. a broken symlink
+    # Cheap substring tests reject most files before the regex runs:
+    # identifiers are quoted, ULIDs start with "01 and UUIDs contain '-'.
+    if b'"' not in data or (b'"01' not in data and b"-" not in data):
+        return []
+
+    found: List[Tuple[str, bytes, int]] = []
+    newline_offsets: Optional[List[int]] = None
+    for match in IDENTIFIER_PATTERN_B.finditer(data):
+        if newline_offsets is None:
+            newline_offsets = _newline_offsets(data)
+        kind = match.lastgroup
+        # Human-readable line number (1-based)
+        line_nr = bisect.bisect_right(newline_offsets, match.start())
+        found.append((kind, match.group(kind), line_nr))
+    return found
+
+
 # --- Issue Types ---
 
 E_DUPLICATE_IDENTIFIER = IssueType(
@@ -135,26 +204,27 @@ class UniqueIdentifiersCheck(ProjectCheck):
         self.ignore_files = (
             ignore_files if ignore_files is not None else DEFAULT_IGNORE_FILES
         )
-        # Precompile regex patterns (already done at module level)
-        self.uuid_pattern = UUID_PATTERN
-        self.ulid_pattern = ULID_PATTERN
-
-    def _is_ignored(self, path: Path, root_path: Path) -> bool:
-        """Check if a path should be ignored."""
-        if path.name in self.ignore_files:
-            return True
-
-        try:
-            # Check if any part of the relative path is an ignored directory name
-            relative_parts = path.relative_to(root_path).parts
-            for part in relative_parts:
-                if part in self.ignore_dirs:
-                    return True
-        except ValueError:
-            # path might not be relative to root_path, shouldn't happen with rglob
-            pass
-
-        return False
+
+    def _iter_source_files(self, root: Path) -> Iterator[str]:
+        """
+        Yields the paths of the source files under root, without descending
+        into ignored directories. Paths are plain strings; callers only build
+        Path objects for files they report on.
+        """
+        for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+            # Prune in place so os.walk never enters ignored directories
+            dirnames[:] = [d for d in dirnames if d not in self.ignore_dirs]
+            for name in filenames:
+                if name in self.ignore_files:
+                    continue
+                # Check file extension - Skip non-source/text files
+                name_lower = name.lower()
+                if not name_lower.endswith(_EXT_TUPLE):
+                    continue
+                # A bare hidden name like ".json" has no extension
+                if name_lower in SOURCE_FILE_EXTENSIONS:
+                    continue
+                yield os.path.join(dirpath, name)
 
     def check(self, path: Path, project: Any) -> List[Issue]:
         """
@@ -170,64 +240,36 @@ class UniqueIdentifiersCheck(ProjectCheck):
             # Or raise ValueError? Returning empty list seems reasonable.
             return []
 
-        seen_ulids: Dict[str, FileLocation] = {}
-        seen_uuids: Dict[str, FileLocation] = {}
+        seen_ulids: Dict[bytes, FileLocation] = {}
+        seen_uuids: Dict[bytes, FileLocation] = {}
         issues = IssueList()  # Use IssueList for potential merging later if needed
 
-        # Walk through all files in the project directory
-        # Using rglob for simplicity, could use os.walk or a dedicated utility
-        for file_path in path.rglob("*"):
-            if not file_path.is_file():
-                continue
+        # Collect the source files first, then scan them, in parallel for
+        # larger projects. Results are merged in walk order, so the "first"
+        # occurrence of an identifier does not depend on scheduling.
+        file_names = list(self._iter_source_files(path))
+        if len(file_names) < PARALLEL_SCAN_MIN_FILES:
+            results = [_scan_one(file_name) for file_name in file_names]
+        else:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_scan_one, file_names, chunksize=64))
 
-            # Check if the file or its parent directories should be ignored
-            if self._is_ignored(file_path, path):
+        for file_name, found in zip(file_names, results):
+            if not found:
                 continue
-
-            # Check file extension - Skip non-source/text files
-            if file_path.suffix.lower() not in SOURCE_FILE_EXTENSIONS:
-                continue
-
-            # Optional: Use get_expected_file_properties if available for a more robust text check
-            # props = get_expected_file_properties(file_path) or ExpectedFileProperties()
-            # if not props.is_text:
-            #     continue
-
-            # Read file content line by line
-            with file_path.open("rt", encoding="utf-8", errors="strict") as fin:
-                for line_nr_zero_based, line_text in enumerate(fin):
-                    line_nr = (
-                        line_nr_zero_based + 1
-                    )  # Human-readable line number (1-based)
-                    current_location = FileLocation(file_path, IntRangeSet([line_nr]))
-
-                    # Find UUIDs
-                    for match in self.uuid_pattern.finditer(line_text):
-                        uuid_val = match.group(1)
-                        if uuid_val in seen_uuids:
-                            first_loc = seen_uuids[uuid_val]
-                            issues.append(
-                                E_DUPLICATE_IDENTIFIER.make(
-                                    identifier=uuid_val,
-                                    first_location=f"{first_loc.path.relative_to(path)}:{first_loc.lines}",  # Make location relative and nice
-                                ).at(file_path, line=line_nr)
-                            )
-                        else:
-                            seen_uuids[uuid_val] = current_location
-
-                    # Find ULIDs
-                    for match in self.ulid_pattern.finditer(line_text):
-                        ulid_val = match.group(1)
-                        if ulid_val in seen_ulids:
-                            first_loc = seen_ulids[ulid_val]
-                            issues.append(
-                                E_DUPLICATE_IDENTIFIER.make(
-                                    identifier=ulid_val,
-                                    first_location=f"{first_loc.path.relative_to(path)}:{first_loc.lines}",  # Make location relative and nice
-                                ).at(file_path, line=line_nr)
-                            )
-                        else:
-                            seen_ulids[ulid_val] = current_location
+            file_path = Path(file_name)
+            for kind, value, line_nr in found:
+                seen = seen_uuids if kind == "uuid" else seen_ulids
+                if value in seen:
+                    first_loc = seen[value]
+                    issues.append(
+                        E_DUPLICATE_IDENTIFIER.make(
+                            identifier=value.decode("ascii"),
+                            first_location=f"{first_loc.path.relative_to(path)}:{first_loc.lines}",  # Make location relative and nice
+                        ).at(file_path, line=line_nr)
+                    )
+                else:
+                    seen[value] = FileLocation(file_path, IntRangeSet([line_nr]))
 
         return issues.issues  # Return the raw list of issues
 
@@ -82,6 +82,21 @@ E_MISSING_GITIGNORE = IssueType(
     "9156d9e0-a4fc-40eb-82e0-26fc22391e8f", "Missing .gitignore file"
 )
 
+# Sections/markers every README should contain, with the issue reported when missing.
+# Kept as UTF-8 bytes so the README never has to be decoded.
+_README_MARKERS: Tuple[Tuple[bytes, IssueType], ...] = (
+    (b'<img src=".banner.png"/>', E_README_NO_BANNER),
+    (b'<img src="https://img.shields.io', E_README_NO_BADGES),
+    ("## 🚀 Installation".encode("utf-8"), E_README_NO_INSTALL),
+    ("## 🚀 Usage".encode("utf-8"), E_README_NO_USAGE),
+    (b"## Licensing", E_README_NO_LICENSE),
+    (b"## Contributing", E_README_NO_CONTRIBUTING),
+)
+# Finds all markers in a single pass over the README
+_README_MARKERS_RE = re.compile(
+    b"|".join(re.escape(marker) for marker, _ in _README_MARKERS)
+)
+
 
 class GenericProjectStructureCheck(ProjectCheck):
     """
@@ -91,34 +106,42 @@ class GenericProjectStructureCheck(ProjectCheck):
     def check(self, path: Path, project: Any) -> List[Issue]:
         issues = []
 
+        # One directory listing instead of a stat() per expected file. Like
+        # Path.exists(), dangling symlinks do not count as present.
+        try:
+            with os.scandir(path) as it:
+                entries = {
+                    entry.name
+                    for entry in it
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                }
+        except OSError:
+            entries = set()
+
         readme_path = path / "README.md"
 
-        if not readme_path.exists():
+        readme_content = None
+        if "README.md" in entries:
+            try:
+                readme_content = readme_path.read_bytes()
+            except OSError:
+                pass
+
+        if readme_content is None:
             issues.append(E_MISSING_README.at(path))
         else:
-            with open(readme_path, "r") as f:
-                readme_content = f.read()
-
-                if '<img src=".banner.png"/>' not in readme_content:
-                    issues.append(E_README_NO_BANNER.at(readme_path))
-                if '<img src="https://img.shields.io' not in readme_content:
-                    issues.append(E_README_NO_BADGES.at(readme_path))
-                if "## 🚀 Installation" not in readme_content:
-                    issues.append(E_README_NO_INSTALL.at(readme_path))
-                if "## 🚀 Usage" not in readme_content:
-                    issues.append(E_README_NO_USAGE.at(readme_path))
-                if "## Licensing" not in readme_content:
-                    issues.append(E_README_NO_LICENSE.at(readme_path))
-                if "## Contributing" not in readme_content:
-                    issues.append(E_README_NO_CONTRIBUTING.at(readme_path))
+            present = {m.group(0) for m in _README_MARKERS_RE.finditer(readme_content)}
+            for marker, issue_type in _README_MARKERS:
+                if marker not in present:
+                    issues.append(issue_type.at(readme_path))
 
-        if not (path / "LICENSE").exists() and not (path / "LICENSE.md").exists():
+        if "LICENSE" not in entries and "LICENSE.md" not in entries:
             issues.append(E_MISSING_LICENSE.at(path))
-        if not (path / "CLA.md").exists():
+        if "CLA.md" not in entries:
             issues.append(E_MISSING_CLA.at(path))
-        if not (path / "CLA_EXPLANATIONS.md").exists():
+        if "CLA_EXPLANATIONS.md" not in entries:
             issues.append(E_MISSING_CLA_SIMPLE.at(path))
-        if not (path / ".gitignore").exists():
+        if ".gitignore" not in entries:
             issues.append(E_MISSING_GITIGNORE.at(path))
 
         return issues
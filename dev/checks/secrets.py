@@ -18,14 +18,17 @@
 
 import re
 import math
+import bisect
 import os
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Optional, Tuple
+from typing import FrozenSet, List, Set, Optional, Tuple
 
 # Import necessary components from your base framework
 # (Adjust the import path if necessary)
 from dev.checks.base import (
-    FileCheck,
+    CachedFileCheck,
     Issue,
     IssueType,
     Severity,
@@ -61,6 +64,9 @@ DEFAULT_HEX_ENTROPY_THRESHOLD = 3.0
 DISABLE_ENTROPY_CHECK_FRAGMENT = "<NO_ENTROPY_CHECK>"
 ENABLE_ENTROPY_CHECK_FRAGMENT = "</NO_ENTROPY_CHECK>"
 
+# Line breaks as recognized when reading in text mode (universal newlines)
+_LINE_BREAK_B = re.compile(rb"\r\n?|\n")
+
 # Regex to find potential URLs. This is a common but not exhaustive pattern.
 # It looks for common schemes or www. and captures characters typical in URLs.
 DEFAULT_URL_REGEX = re.compile(
@@ -68,6 +74,30 @@ DEFAULT_URL_REGEX = re.compile(
     re.IGNORECASE,
 )
 
+
+def _line_starts(data: bytes) -> List[int]:
+    """Returns the offset at which each line of data starts."""
+    return [0] + [m.end() for m in _LINE_BREAK_B.finditer(data)]
+
+
+@lru_cache(maxsize=32)
+def _compile_charset_re(charset: str, min_length: int) -> re.Pattern:
+    """
+    Compiles a bytes pattern matching runs of at least min_length characters
+    from charset. Shared by all checker instances with the same settings.
+    """
+    # Use re.escape to handle special characters like '+' and '/' in BASE64_CHARS
+    return re.compile(f"[{re.escape(charset)}]{{{min_length},}}".encode("ascii"))
+
+
+@lru_cache(maxsize=32)
+def _to_bytes_pattern(pattern: re.Pattern) -> re.Pattern:
+    """Compiles an ASCII str pattern for matching against bytes."""
+    if isinstance(pattern.pattern, bytes):
+        return pattern
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+
+
 # --- Issue Type ---
 
 E_HIGH_ENTROPY_STRING = IssueType(
@@ -83,7 +113,7 @@ E_ENTROPY_CHECK_READ_ERROR = IssueType(
 # --- FileCheck Implementation ---
 
 
-class HighEntropyStringCheck(FileCheck):
+class HighEntropyStringCheck(CachedFileCheck):
     """
     Scans text files for high entropy strings (potential secrets) like Base64 or Hex,
     while attempting to ignore strings that are part of URLs.
@@ -112,21 +142,28 @@ class HighEntropyStringCheck(FileCheck):
         """
         if min_length <= 0:
             raise ValueError("min_length must be positive")
+        if not (base64_chars.isascii() and hex_chars.isascii()):
+            raise ValueError("base64_chars and hex_chars must be ASCII")
 
         self.min_length = min_length
         self.b64_threshold = b64_entropy_threshold
         self.hex_threshold = hex_entropy_threshold
-        self.url_regex = url_regex
+        self.url_regex = _to_bytes_pattern(url_regex)
         self.base64_chars = base64_chars
         self.hex_chars = hex_chars
         self.non_secret_sequences = non_secret_sequences
-
-        # Compile regex for Base64 and Hex strings based on min_length and char sets
-        # Use re.escape to handle special characters like '+' and '/' in BASE64_CHARS
-        self.b64_regex = re.compile(
-            f"[{re.escape(self.base64_chars)}]{{{self.min_length},}}"
-        )
-        self.hex_regex = re.compile(f"[{self.hex_chars}]{{{self.min_length},}}")
+        # Alphabets as sets, for membership tests during entropy calculation
+        self._b64_set = frozenset(self.base64_chars)
+        self._hex_set = frozenset(self.hex_chars)
+
+        # Regexes for Base64 and Hex strings based on min_length and char sets.
+        # Files are scanned as bytes, so the patterns are bytes patterns too.
+        self.b64_regex = _compile_charset_re(self.base64_chars, self.min_length)
+        self.hex_regex = _compile_charset_re(self.hex_chars, self.min_length)
+        # With the default alphabets every hex run lies inside a Base64 run, so a
+        # single Base64 pass finds all candidates and hex runs are looked up
+        # only within it.
+        self._hex_in_b64 = self._hex_set <= self._b64_set
 
     def _shannon_entropy(self, data: str, iterator: str) -> float:
         """
@@ -134,38 +171,87 @@ class HighEntropyStringCheck(FileCheck):
         """
         if not data:
             return 0.0
-        entropy: float = 0.0
-        data_len = float(len(data))  # Use float for division
+        allowed: FrozenSet[str]
+        if iterator == self.base64_chars:
+            allowed = self._b64_set
+        elif iterator == self.hex_chars:
+            allowed = self._hex_set
+        else:
+            allowed = frozenset(iterator)
+
+        data_len = len(data)
+        # Use only characters from the specified iterator set found in the data
+        return -sum(
+            (count / data_len) * math.log2(count / data_len)
+            for char, count in Counter(data).items()
+            if char in allowed
+        )
 
-        char_counts = {}
-        for char in data:
-            char_counts[char] = char_counts.get(char, 0) + 1
+    def _candidate_entropy(self, string: str, kind: str) -> Optional[float]:
+        """
+        Returns the entropy of a Base64 or Hex candidate if it exceeds the
+        threshold for its kind, otherwise None.
+        """
+        for non_secret in self.non_secret_sequences:
+            if non_secret in string:
+                # Remove non-secret sequences from the string
+                string = string.replace(non_secret, "")
 
-        # Use only characters from the specified iterator set found in the data
-        for char in iterator:
-            count = char_counts.get(char, 0)
-            if count > 0:
-                p_x = float(count) / data_len
-                entropy -= p_x * math.log(p_x, 2)  # log base 2 for Shannon entropy
-        return entropy
+        if kind == "Hex":
+            entropy = self._shannon_entropy(string, self.hex_chars)
+            return entropy if entropy > self.hex_threshold else None
+        entropy = self._shannon_entropy(string, self.base64_chars)
+        return entropy if entropy > self.b64_threshold else None
 
     def _check_overlap(
-        self, secret_start: int, secret_end: int, url_spans: List[Tuple[int, int]]
+        self,
+        secret_start: int,
+        secret_end: int,
+        url_spans: List[Tuple[int, int]],
+        url_ends: List[int],
     ) -> bool:
-        """Checks if the secret span overlaps with any of the URL spans."""
-        for url_start, url_end in url_spans:
-            # Check for any overlap:
-            # Max of starts < Min of ends indicates overlap
-            if max(secret_start, url_start) < min(secret_end, url_end):
-                return True
-        return False
+        """
+        Checks if the secret span overlaps with any of the URL spans.
+
+        url_spans must be sorted and non-overlapping (as produced by finditer),
+        and url_ends must hold their end positions in the same order.
+        """
+        # Only the first URL ending after the secret starts can overlap it
+        i = bisect.bisect_right(url_ends, secret_start)
+        return i < len(url_spans) and url_spans[i][0] < secret_end
+
+    def _config_fingerprint(self) -> str:
+        return repr(
+            (
+                self.min_length,
+                self.b64_threshold,
+                self.hex_threshold,
+                self.url_regex.pattern,
+                self.url_regex.flags,
+                self.base64_chars,
+                self.hex_chars,
+                sorted(self.non_secret_sequences),
+            )
+        )
+
+    def _may_contain_candidates(self, data: bytes) -> bool:
+        """
+        Cheap whole-file gate. A string made of k distinct characters has an
+        entropy of at most log2(k), so unless the file contains more than
+        2**threshold distinct characters of an alphabet, no candidate from
+        that alphabet can exceed the threshold and the scan can be skipped.
+        """
+        present = set(data)
+        b64_distinct = sum(1 for c in self._b64_set if ord(c) in present)
+        hex_distinct = sum(1 for c in self._hex_set if ord(c) in present)
+        return (
+            b64_distinct > 2**self.b64_threshold or hex_distinct > 2**self.hex_threshold
+        )
 
     def check(self, path: Path, ctx: FileContext = FileContext()) -> List[Issue]:
         """
         Performs the high-entropy string check on the given file.
         """
-        issues = IssueList()
-
         # --- Pre-checks ---
         # 1. Skip non-files or symlinks (optional, could be handled by caller)
         if not path.is_file():
@@ -181,95 +267,129 @@ class HighEntropyStringCheck(FileCheck):
             # e.g., read first few KB, check for null bytes percentage
             return []
 
-        # --- Main Processing ---
-        line_number = 0
         try:
-            with path.open("rt", encoding="utf-8", errors="strict") as f:
-                is_enabled = True
-                for line in f:
-                    line_number += 1
-                    original_line = (
-                        line.strip()
-                    )  # Keep for context if needed, but avoid putting in issue data by default
-
-                    if not is_enabled:
-                        # Skip lines if entropy check is disabled
-                        continue
-
-                    if DISABLE_ENTROPY_CHECK_FRAGMENT in line:
-                        is_enabled = False
-                    elif ENABLE_ENTROPY_CHECK_FRAGMENT in line:
-                        is_enabled = True
-
-                    # 1. Find all URL spans in the current line
-                    url_spans = [
-                        (m.start(), m.end()) for m in self.url_regex.finditer(line)
-                    ]
-
-                    # 2. Find potential Base64 strings
-                    for match in self.b64_regex.finditer(line):
-                        string = match.group(0)
-                        start, end = match.span()
-
-                        # 3. Check overlap with URLs
-                        if self._check_overlap(start, end, url_spans):
-                            continue  # Skip if likely part of a URL
-
-                        for non_secret in self.non_secret_sequences:
-                            if non_secret in string:
-                                # Remove non-secret sequences from the string
-                                string = string.replace(non_secret, "")
-
-                        # 4. Calculate entropy
-                        b64_entropy = self._shannon_entropy(string, self.base64_chars)
-
-                        # 5. Check threshold and report
-                        if b64_entropy > self.b64_threshold:
-                            issues.append(
-                                E_HIGH_ENTROPY_STRING.make(
-                                    filename=path.name,  # Just filename for brevity
-                                    type="Base64",
-                                    entropy=b64_entropy,
-                                    # Avoid including 'secret=string' directly in data for security
-                                    # Consider adding line_preview=original_line[:100] if context needed
-                                ).at(path, line=line_number)
-                            )
-                            # Don't check the same string multiple times if nested B64 patterns match
-                            # Breaking here might miss overlapping valid secrets, careful
-                            # break
-
-                    # 6. Find potential Hex strings
-                    for match in self.hex_regex.finditer(line):
-                        string = match.group(0)
-                        start, end = match.span()
-
-                        # 7. Check overlap with URLs
-                        if self._check_overlap(start, end, url_spans):
-                            continue  # Skip if likely part of a URL
-
-                        for non_secret in self.non_secret_sequences:
-                            if non_secret in string:
-                                # Remove non-secret sequences from the string
-                                string = string.replace(non_secret, "")
-
-                        # 8. Calculate entropy
-                        hex_entropy = self._shannon_entropy(string, self.hex_chars)
-
-                        # 9. Check threshold and report
-                        if hex_entropy > self.hex_threshold:
-                            issues.append(
-                                E_HIGH_ENTROPY_STRING.make(
-                                    filename=path.name, type="Hex", entropy=hex_entropy
-                                ).at(path, line=line_number)
-                            )
-                            # break # Optional break
-
+            data = path.read_bytes()
         except (IOError, OSError) as e:
-            issues.append(
+            return [
                 E_ENTROPY_CHECK_READ_ERROR.make(
                     filename=path.name, error=f"I/O error: {e}"
                 ).at(path)
+            ]
+
+        # Unchanged files are not scanned again
+        return self._cached(path, data, ctx, lambda: self._scan(path, data))
+
+    def _scan(self, path: Path, data: bytes) -> List[Issue]:
+        """
+        Scans the contents of a file for high-entropy strings.
+        """
+        issues = IssueList()
+
+        # --- Main Processing ---
+        try:
+            # The file must be valid UTF-8; only the lines before the first
+            # invalid sequence are scanned.
+            decode_error: Optional[UnicodeDecodeError] = None
+            try:
+                data.decode("utf-8")
+            except UnicodeDecodeError as e:
+                decode_error = e
+            else:
+                if not self._may_contain_candidates(data):
+                    return []
+            scan_end = len(data)
+            if decode_error is not None:
+                scan_end = max(
+                    data.rfind(b"\n", 0, decode_error.start),
+                    data.rfind(b"\r", 0, decode_error.start),
+                )
+                scan_end = max(scan_end + 1, 0)
+
+            # Nothing after the line that disables the check is scanned
+            disabled_at = data.find(DISABLE_ENTROPY_CHECK_FRAGMENT.encode("ascii"))
+            if 0 <= disabled_at < scan_end:
+                line_end = _LINE_BREAK_B.search(data, disabled_at)
+                scan_end = line_end.end() if line_end else len(data)
+
+            # Line numbers are only needed once something is reported
+            line_starts: Optional[List[int]] = None
+
+            def report(position: int, kind: str, entropy: float) -> None:
+                nonlocal line_starts
+                if line_starts is None:
+                    line_starts = _line_starts(data)
+                issues.append(
+                    E_HIGH_ENTROPY_STRING.make(
+                        filename=path.name,  # Just filename for brevity
+                        type=kind,
+                        entropy=entropy,
+                        # Avoid including 'secret=string' directly in data for security
+                    ).at(path, line=bisect.bisect_right(line_starts, position))
+                )
+
+            # 1. Find the candidate runs. Custom alphabets need a separate Hex pass
+            b64_matches = list(self.b64_regex.finditer(data, 0, scan_end))
+            hex_matches = (
+                []
+                if self._hex_in_b64
+                else list(self.hex_regex.finditer(data, 0, scan_end))
             )
+
+            # 2. Find all URL spans (URLs never span lines), unless there is
+            # nothing they could rule out
+            url_spans: List[Tuple[int, int]] = []
+            if b64_matches or hex_matches:
+                url_spans = [
+                    (m.start(), m.end())
+                    for m in self.url_regex.finditer(data, 0, scan_end)
+                ]
+            url_ends = [url_end for _, url_end in url_spans]
+
+            # 3. Go through potential Base64 strings (and the Hex strings within them)
+            for match in b64_matches:
+                start, end = match.span()
+                string = match.group(0).decode("ascii")
+
+                # 4. Check overlap with URLs (skip if likely part of a URL)
+                in_url = self._check_overlap(start, end, url_spans, url_ends)
+
+                # 5. Classify: a run made only of hex digits is a Hex candidate,
+                # otherwise the run is Base64 and may contain Hex runs
+                candidates: List[Tuple[str, str]] = []
+                if self._hex_in_b64 and self._hex_set.issuperset(string):
+                    if not in_url:
+                        candidates.append((string, "Hex"))
+                else:
+                    if not in_url:
+                        candidates.append((string, "Base64"))
+                    if self._hex_in_b64:
+                        candidates.extend(
+                            (hex_match.group(0).decode("ascii"), "Hex")
+                            for hex_match in self.hex_regex.finditer(data, start, end)
+                            if not in_url
+                            or not self._check_overlap(
+                                *hex_match.span(), url_spans, url_ends
+                            )
+                        )
+
+                # 6. Calculate entropy, check threshold and report
+                for string, kind in candidates:
+                    entropy = self._candidate_entropy(string, kind)
+                    if entropy is not None:
+                        report(start, kind, entropy)
+
+            # 7. Custom alphabets: Hex strings from their own pass
+            for match in hex_matches:
+                start, end = match.span()
+                if self._check_overlap(start, end, url_spans, url_ends):
+                    continue  # Skip if likely part of a URL
+                entropy = self._candidate_entropy(match.group(0).decode("ascii"), "Hex")
+                if entropy is not None:
+                    report(start, "Hex", entropy)
+
+            if decode_error is not None:
+                raise decode_error
+
         except UnicodeDecodeError as e:
             issues.append(
                 E_ENTROPY_CHECK_READ_ERROR.make(
@@ -20,7 +20,7 @@
 """
 
 from dev.checks.base import (
-    FileCheck,
+    CachedFileCheck,
     Issue,
     Severity,
     IssueType,
@@ -30,8 +30,13 @@ from dev.checks.base import (
     CoarseProjectType,
 )
 from dataclasses import dataclass, field  # Added field
+from functools import partial
 from typing import List, Optional, Dict, Any
 import enum
+import io
+import os
+import shutil
+import tempfile
 
 from pathlib import Path
 import re
@@ -39,7 +44,6 @@ import unicodedata  # Needed for Unicode checks
 
 from dev.file_properties import ExpectedFileProperties, get_expected_file_properties
 
-
 CHUNK_BYTE_SIZE = 1024 * 1024  # 1 MB
 
 
@@ -49,66 +53,39 @@ class LineEnding(enum.Enum):
     CR = b"\r"
 
 
+def _count_line_endings(content: bytes) -> Dict[LineEnding, int]:
+    # Every CRLF is also counted as one CR and one LF
+    crlf_count = content.count(b"\r\n")
+    return {
+        LineEnding.CRLF: crlf_count,
+        LineEnding.LF: content.count(b"\n") - crlf_count,
+        LineEnding.CR: content.count(b"\r") - crlf_count,
+    }
+
+
 def get_line_ending_counts(file: Path) -> Dict[LineEnding, int]:
-    crlf_count = 0
-    lf_count = 0
-    cr_count = 0
-
-    STATE_OUTSIDE = 0
-    STATE_CR = 1
-    STATE_LF = 2
-
-    state = STATE_OUTSIDE
-
-    def update(byte: bytes):
-        nonlocal crlf_count, lf_count, cr_count, state
-        if state == STATE_OUTSIDE:
-            if byte == b"\r":
-                state = STATE_CR
-            elif byte == b"\n":
-                state = STATE_LF
-            else:
-                return
-        elif state == STATE_CR:
-            if byte == b"\r":
-                cr_count += 1
-            elif byte == b"\n":
-                crlf_count += 1
-                state = STATE_OUTSIDE
-            else:
-                cr_count += 1
-                state = STATE_OUTSIDE
-        elif state == STATE_LF:
-            if byte == b"\r":
-                lf_count += 1
-                state = STATE_CR
-            elif byte == b"\n":
-                lf_count += 1
-                state = STATE_LF
-            else:
-                lf_count += 1
-                state = STATE_OUTSIDE
-        else:
-            raise ValueError("Invalid state")
+    counts = dict.fromkeys(LineEnding, 0)
+    # Whether the previous chunk ended in "\r", so a "\r\n" may span chunks
+    prev_ends_with_cr = False
 
     with file.open("rb") as f:
         while True:
             chunk = f.read(CHUNK_BYTE_SIZE)
             if not chunk:
-                update(None)
                 break
-            for byte in chunk:
-                update(byte)
+            for ending, count in _count_line_endings(chunk).items():
+                counts[ending] += count
+            if prev_ends_with_cr and chunk.startswith(b"\n"):
+                # Counted as a lone CR and a lone LF, but is one CRLF
+                counts[LineEnding.CRLF] += 1
+                counts[LineEnding.CR] -= 1
+                counts[LineEnding.LF] -= 1
+            prev_ends_with_cr = chunk.endswith(b"\r")
 
-    return {
-        LineEnding.CRLF: crlf_count,
-        LineEnding.LF: lf_count,
-        LineEnding.CR: cr_count,
-    }
+    return counts
 
 
-def get_line_ending(file: Path) -> Optional[LineEnding]:
-    counts = get_line_ending_counts(file)
+def _dominant_line_ending(counts: Dict[LineEnding, int]) -> LineEnding:
     crlf_count = counts[LineEnding.CRLF]
     lf_count = counts[LineEnding.LF]
     cr_count = counts[LineEnding.CR]
@@ -121,41 +98,91 @@ def get_line_ending(file: Path) -> Optional[LineEnding]:
     return result
 
 
-def fix_no_newline(file: Path) -> None:
-    nl = get_line_ending(file)
-    with file.open("rb") as f:
-        content = f.read()
-    if not content.endswith(nl.value):
-        with file.open("ab") as f:
-            f.write(nl.value)
+def get_line_ending(file: Path) -> Optional[LineEnding]:
+    return _dominant_line_ending(get_line_ending_counts(file))
 
 
-def fix_line_endings(file: Path, target_ending: LineEnding) -> None:
-    with file.open("rb") as f:
-        content = f.read()
-    # Convert line endings to LF
+_ANY_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+def fix_text_file(
+    file: Path,
+    target_ending: Optional[LineEnding] = None,
+    strip_trailing: bool = False,
+    ensure_final_newline: bool = False,
+) -> None:
+    """
+    Applies the requested text fixes with a single read and a single write.
+
+    Trailing whitespace is stripped first (which also terminates the last line),
+    then line endings are converted to ``target_ending``, and finally a final
+    newline is appended if the file does not end in ``"\n"`` (``"\r\n"`` when
+    that is the dominant line ending). Trailing whitespace is stripped using
+    the dominant line ending of the file. The result replaces the file
+    atomically.
+    """
+    original = content = file.read_bytes()
+
+    if strip_trailing:
+        nl = _dominant_line_ending(_count_line_endings(content)).value
+        lines = _ANY_LINE_BREAK.split(content.decode("utf-8"))
+        if not lines[-1]:
+            lines.pop()
+        content = b"".join(line.rstrip().encode("utf-8") + nl for line in lines)
+
     if target_ending == LineEnding.LF:
         content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
     elif target_ending == LineEnding.CR:
         content = content.replace(b"\r\n", b"\r").replace(b"\n", b"\r")
     elif target_ending == LineEnding.CRLF:
-        content = re.sub(b"(?:\r\n|\r|\n)", b"\r\n", content)
-    with file.open("wb") as f:
-        f.write(content)
+        content = (
+            content.replace(b"\r\n", b"\n")
+            .replace(b"\r", b"\n")
+            .replace(b"\n", b"\r\n")
+        )
+
+    if ensure_final_newline and not content.endswith(b"\n"):
+        # E_NO_NEWLINE asks for a final "\n", so a CR-only file gets one too
+        nl = _dominant_line_ending(_count_line_endings(content))
+        content += b"\r\n" if nl == LineEnding.CRLF else b"\n"
+
+    if content == original:
+        return
+
+    fd, tmp_name = tempfile.mkstemp(dir=file.parent, prefix=f".{file.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        shutil.copymode(file, tmp_name)
+        os.replace(tmp_name, file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def fix_no_newline(file: Path) -> None:
+    fix_text_file(file, ensure_final_newline=True)
+
+
+def fix_line_endings(file: Path, target_ending: LineEnding) -> None:
+    fix_text_file(file, target_ending=target_ending)
 
 
 def fix_trailing_whitespace(file: Path) -> None:
-    nl = get_line_ending(file).value.decode("utf-8")
-    with file.open("rt", encoding="utf-8") as f:
-        lines = f.readlines()
-    # Remove trailing whitespace from each line
-    with file.open("wt", encoding="utf-8") as f:
-        for line in lines:
-            f.write(line.rstrip() + nl)
+    fix_text_file(file, strip_trailing=True)
 
 
-MAX_CODE_LINE_LENGTH = 200  # Default maximum line length for code files
+# Byte order marks, by the encoding they announce
+_BOMS: Dict[bytes, str] = {
+    b"\xef\xbb\xbf": "utf-8",
+    b"\xff\xfe\x00\x00": "utf-32-le",
+    b"\x00\x00\xfe\xff": "utf-32-be",
+    b"\xff\xfe": "utf-16-le",
+    b"\xfe\xff": "utf-16-be",
+    b"\x2b\x2f\x76": "utf-7",  # Rare and not recommended, but still a BOM
+}
 
+MAX_CODE_LINE_LENGTH = 200  # Default maximum line length for code files
 
 E_NO_NEWLINE = IssueType(
     "236fdabb-4175-4b0a-b2c7-a19e2857ce72",
@@ -198,7 +225,7 @@ E_UNICODE_INVISIBLE = IssueType(
 )
 
 
-class TextQualityCheck(FileCheck):
+class TextQualityCheck(CachedFileCheck):
     """
     Performs various quality checks on text files, including encoding, line endings,
     whitespace issues, line length, special characters, and potential git conflicts.
@@ -234,197 +261,221 @@ class TextQualityCheck(FileCheck):
         if not props.is_text:
             return []
 
-        content_bytes = file.read_bytes()
-        if not content_bytes:
+        content = file.read_bytes()
+        if not content:
             return []  # Skip empty files
 
+        # Unchanged files are not scanned again
+        # The scan depends on props, so a reclassified file is scanned again
+        return self._cached(
+            file,
+            content,
+            ctx,
+            lambda: self._scan(file, content, ctx, props),
+            extra_key=props,
+        )
+
+    def _scan(
+        self,
+        file: Path,
+        content: bytes,
+        ctx: FileContext | None,
+        props: ExpectedFileProperties,
+    ) -> List[Issue]:
+        """
+        Checks the file's content, which is read once by check() and shared
+        by the cache key, the byte-level checks and the line checks.
+        """
         issues = IssueList()
 
         ###################################################################
         # Byte-based checks (before decoding)
         ###################################################################
 
+        head = content[:4]
         is_invalid_encoding = False
-        if content_bytes.startswith(b"\xef\xbb\xbf"):  # UTF-8 BOM
-            issues.append(E_BOM_AT_START.at(file))
-        elif content_bytes.startswith(b"\xff\xfe\x00\x00") or content_bytes.startswith(
-            b"\x00\x00\xfe\xff"
-        ):  # UTF-32 BOM
+        # Longest BOMs first, so UTF-32 LE is not mistaken for UTF-16 LE
+        bom = _BOMS.get(head) or _BOMS.get(head[:3]) or _BOMS.get(head[:2])
+        if bom is not None:
             issues.append(E_BOM_AT_START.at(file))
-            issues.append(E_NOT_UTF8.at(file))  # Not valid UTF-8
-            is_invalid_encoding = True
-        elif content_bytes.startswith(b"\xff\xfe") or content_bytes.startswith(
-            b"\xfe\xff"
-        ):  # UTF-16 BOM
-            issues.append(E_BOM_AT_START.at(file))
-            issues.append(E_NOT_UTF8.at(file))  # Not valid UTF-8
-            is_invalid_encoding = True
-        elif content_bytes.startswith(b"\x2b\x2f\x76"):  # UTF-7 BOM
-            # Note: UTF-7 BOM is rare and not recommended, but we can check for it if needed.
-            issues.append(E_BOM_AT_START.at(file))
-            issues.append(E_NOT_UTF8.at(file))  # Not valid UTF-8
-            is_invalid_encoding = True
+            if bom != "utf-8":
+                issues.append(E_NOT_UTF8.at(file))  # Not valid UTF-8
+                is_invalid_encoding = True
+
+        ###################################################################
+        # Decoding and String-based checks
+        ###################################################################
+
+        # Try UTF-8 first, then common alternatives. Lines are decoded one at a
+        # time; if a line does not decode, the file is rescanned with the next
+        # encoding.
+        encodings = [] if is_invalid_encoding else ["utf-8", "latin-1", "cp1252"]
+        detected_encoding: Optional[str] = None
+        line_issues = IssueList()  # Cannot proceed with string checks otherwise
+        for encoding in encodings:
+            try:
+                line_issues = self._scan_lines(file, content, ctx, props, encoding)
+                detected_encoding = encoding
+                break
+            except UnicodeDecodeError:
+                continue
 
         # Check Line Endings based on bytes (more robust than decoded text)
-        if not props.is_crlf_native and b"\r\n" in content_bytes:
+        if not props.is_crlf_native and b"\r\n" in content:
             issues.append(
                 E_LINE_ENDINGS.at(file).fixable(
-                    lambda: fix_line_endings(file, LineEnding.LF)
+                    partial(fix_text_file, file, target_ending=LineEnding.LF)
                 )
             )
 
         if props.is_crlf_native:
-            line_ending_counts = get_line_ending_counts(file)
+            line_ending_counts = _count_line_endings(content)
             if (
                 line_ending_counts[LineEnding.LF] > 0
                 or line_ending_counts[LineEnding.CR] > 0
             ):
                 issues.append(
                     E_LINE_ENDINGS.at(file).fixable(
-                        lambda: fix_line_endings(file, LineEnding.CRLF)
+                        partial(fix_text_file, file, target_ending=LineEnding.CRLF)
                     )
                 )
 
-        ###################################################################
-        # Decoding and String-based checks
-        ###################################################################
+        if not is_invalid_encoding and detected_encoding != "utf-8":
+            if detected_encoding is not None:
+                issues.append(
+                    E_NOT_UTF8.make(detected_encoding=detected_encoding).at(file)
+                )
+            else:
+                issues.append(E_NOT_UTF8.at(file))
 
-        text: Optional[str] = None
-        detected_encoding = "utf-8"  # Assume UTF-8 initially
+        if not content.endswith(b"\n") and (file.suffix not in (".json")):
+            issues.append(
+                E_NO_NEWLINE.at(file).fixable(
+                    partial(fix_text_file, file, ensure_final_newline=True)
+                )
+            )
 
-        if not is_invalid_encoding:
-            try:
-                text = content_bytes.decode("utf-8")
-            except UnicodeDecodeError as e:
-                # Try to detect common alternatives if UTF-8 fails
-                try:
-                    # Attempt Latin-1 (common fallback)
-                    text = content_bytes.decode("latin-1")
-                    detected_encoding = "latin-1"
-                    issues.append(
-                        E_NOT_UTF8.make(detected_encoding=detected_encoding).at(file)
-                    )
-                except UnicodeDecodeError:
-                    # Attempt Windows-1252 (another common one)
-                    try:
-                        text = content_bytes.decode("cp1252")
-                        detected_encoding = "cp1252"
-                        issues.append(
-                            E_NOT_UTF8.make(detected_encoding=detected_encoding).at(
-                                file
-                            )
-                        )
-                    except UnicodeDecodeError:
-                        issues.append(E_NOT_UTF8.at(file))
-                        text = None  # Cannot proceed with string checks
-
-        else:
-            text = None  # Cannot proceed with string checks
+        issues.extend(line_issues)
+        return issues
 
-        ###################################################################
-        # String-based checks (after decoding)
-        ###################################################################
+    def _scan_lines(
+        self,
+        file: Path,
+        content: bytes,
+        ctx: FileContext | None,
+        props: ExpectedFileProperties,
+        encoding: str,
+    ) -> IssueList:
+        """
+        Runs the line checks over the content decoded with the given encoding.
+        Raises UnicodeDecodeError if a line cannot be decoded.
+        """
+        issues = IssueList()
+        line_nr = 0
+        check_line = self._check_line
+        # Binary streams iterate by "\n"; the other line breaks that
+        # str.splitlines() recognizes are split within each piece.
+        for raw_line in io.BytesIO(content):
+            for line in raw_line.decode(encoding).splitlines():
+                line_nr += 1
+                check_line(file, ctx, props, line, line_nr, issues)
+        return issues
 
-        if not content_bytes.endswith(b"\n") and (file.suffix not in (".json")):
-            issues.append(E_NO_NEWLINE.at(file).fixable(lambda: fix_no_newline(file)))
-
-        if text is not None:
-            lines = (
-                text.splitlines()
-            )  # Don't keep ends, use original line endings from bytes if needed
-
-            for i, line in enumerate(lines):
-                line_nr = i + 1
-
-                # Check for Git Conflict Markers
-                if line.startswith(self._git_conflict_markers):
-                    issues.append(E_GIT_CONFLICT_MARKER.at(file, line=line_nr))
-                    # Often conflict markers break other checks, maybe continue to next line?
-
-                # Check for Long Lines (only for code files)
-                if props.is_code and not (
-                    ctx and ctx.project_type == CoarseProjectType.DATA
-                ):
-                    # Note: len() works on Unicode characters, not bytes. This is usually what's desired.
-                    if len(line) > MAX_CODE_LINE_LENGTH:
-                        issues.append(
-                            E_LINE_TOO_LONG.make(
-                                actual=len(line), max=MAX_CODE_LINE_LENGTH
-                            ).at(file, line=line_nr)
-                        )
-
-                # Check for Trailing Whitespace
-                if line != line.rstrip(" \t"):
-                    issues.append(
-                        E_TRAILING_WHITESPACE.at(file, line=line_nr).fixable(
-                            lambda: fix_trailing_whitespace(file)
-                        )
+    def _check_line(
+        self,
+        file: Path,
+        ctx: FileContext | None,
+        props: ExpectedFileProperties,
+        line: str,
+        line_nr: int,
+        issues: IssueList,
+    ) -> None:
+        # Check for Git Conflict Markers
+        if line.startswith(self._git_conflict_markers):
+            issues.append(E_GIT_CONFLICT_MARKER.at(file, line=line_nr))
+            # Often conflict markers break other checks, maybe continue to next line?
+
+        # Check for Long Lines (only for code files)
+        if props.is_code and not (ctx and ctx.project_type == CoarseProjectType.DATA):
+            # Note: len() works on Unicode characters, not bytes. This is usually what's desired.
+            if len(line) > MAX_CODE_LINE_LENGTH:
+                issues.append(
+                    E_LINE_TOO_LONG.make(actual=len(line), max=MAX_CODE_LINE_LENGTH).at(
+                        file, line=line_nr
                     )
+                )
 
-                # Check for Mixed Spaces and Tabs in Indentation
-                leading_whitespace = ""
-                for char in line:
-                    if char == " " or char == "\t":
-                        leading_whitespace += char
-                    else:
-                        break
-                if " " in leading_whitespace and "\t" in leading_whitespace:
-                    issues.append(E_MIXED_SPACES_TABS.at(file, line=line_nr))
-
-                # Character-level checks within the line
-                control_chars = set()
-                invisible_chars = set()
-                homoglyphs = set()
-                for j, char in enumerate(line):
-                    col_nr = j + 1
-                    char_ord = ord(char)
-                    category = unicodedata.category(
-                        char
-                    )  # Get Unicode category (e.g., 'Lu', 'Ll', 'Cc', 'Cf', 'Zs')
-
-                    # Check for Unexpected Control Characters
-                    # C0 controls (U+0000-U+001F) & C1 controls (U+007F-U+009F)
-                    # Exclude tab (U+0009), Line Feed (U+000A), Carriage Return (U+000D)
-                    if category == "Cc" and char not in ("\t", "\n", "\r"):
-                        control_chars.add(char)
-
-                    # # Check for Unicode Homoglyphs (simplified: non-ASCII letters)
-                    # # This is a heuristic. True homoglyph detection is complex.
-                    # # We flag non-ASCII letters as potentially confusing or unintended.
-                    # if self.config.check_unicode_homoglyphs:
-                    #      # Check if it's a letter ('L' category) and outside basic ASCII (<=127)
-                    #      if category.startswith('L') and char_ord > 127:
-                    #          issues.append(Issue(
-                    #              Severity.WARNING, f"Line {line_nr}, Column {col_nr}: Contains non-ASCII letter '{char}' (U+{char_ord:04X}). Potential homoglyph or unintended character.",
-                    #              [file], line_nr=line_nr, col_nr=col_nr))
-
-                    # Check for Unicode Invisible/Formatting Characters
-                    # Flag Format chars (Cf), non-standard spaces (Zs != ' '), Line/Para separators (Zl, Zp)
-                    # Also check specific common invisible chars just in case.
-                    if (
-                        category == "Cf"
-                        or (category == "Zs" and char != " ")
-                        or category == "Zl"
-                        or category == "Zp"
-                        or char in self._explicit_invisible_chars
-                    ):
-                        # Avoid double-reporting BOM if already caught by byte check
-                        invisible_chars.add(char)
-
-                if control_chars:
-                    # Report all control characters found in the line
-                    issues.append(
-                        E_UNEXPECTED_CONTROL_CHARACTER.make(
-                            control_chars=", ".join(repr(c) for c in control_chars)
-                        ).at(file, line=line_nr)
-                    )
+        # Check for Trailing Whitespace
+        if line.endswith((" ", "\t")):
+            issues.append(
+                E_TRAILING_WHITESPACE.at(file, line=line_nr).fixable(
+                    partial(fix_text_file, file, strip_trailing=True)
+                )
+            )
 
-                if invisible_chars:
-                    # Report all invisible characters found in the line
-                    issues.append(
-                        E_UNICODE_INVISIBLE.make(
-                            invisible_chars=", ".join(repr(c) for c in invisible_chars)
-                        ).at(file, line=line_nr)
-                    )
+        # Check for Mixed Spaces and Tabs in Indentation
+        leading_whitespace = line[: len(line) - len(line.lstrip(" \t"))]
+        if " " in leading_whitespace and "\t" in leading_whitespace:
+            issues.append(E_MIXED_SPACES_TABS.at(file, line=line_nr))
+
+        # Character-level checks within the line
+        control_chars = set()
+        invisible_chars = set()
+        homoglyphs = set()
+        # Every character reported below is in a C* or Z* category, so a line
+        # that str.isprintable() accepts needs no further scanning, and only
+        # the non-printable characters of the others are classified
+        suspicious = (
+            ()
+            if line.isprintable()
+            else {char for char in line if not char.isprintable()}
+        )
+        for char in suspicious:
+            category = unicodedata.category(
+                char
+            )  # Get Unicode category (e.g., 'Lu', 'Ll', 'Cc', 'Cf', 'Zs')
+
+            # Check for Unexpected Control Characters
+            # C0 controls (U+0000-U+001F) & C1 controls (U+007F-U+009F)
+            # Exclude tab (U+0009), Line Feed (U+000A), Carriage Return (U+000D)
+            if category == "Cc" and char not in ("\t", "\n", "\r"):
+                control_chars.add(char)
+
+            # # Check for Unicode Homoglyphs (simplified: non-ASCII letters)
+            # # This is a heuristic. True homoglyph detection is complex.
+            # # We flag non-ASCII letters as potentially confusing or unintended.
+            # if self.config.check_unicode_homoglyphs:
+            #      # Check if it's a letter ('L' category) and outside basic ASCII (<=127)
+            #      if category.startswith('L') and char_ord > 127:
+            #          issues.append(Issue(
+            #              Severity.WARNING, f"Line {line_nr}, Column {col_nr}: Contains non-ASCII letter '{char}' (U+{char_ord:04X}). Potential homoglyph or unintended character.",
+            #              [file], line_nr=line_nr, col_nr=col_nr))
+
+            # Check for Unicode Invisible/Formatting Characters
+            # Flag Format chars (Cf), non-standard spaces (Zs != ' '), Line/Para separators (Zl, Zp)
+            # Also check specific common invisible chars just in case.
+            if (
+                category == "Cf"
+                or (category == "Zs" and char != " ")
+                or category == "Zl"
+                or category == "Zp"
+                or char in self._explicit_invisible_chars
+            ):
+                # Avoid double-reporting BOM if already caught by byte check
+                invisible_chars.add(char)
 
-        return issues
+        if control_chars:
+            # Report all control characters found in the line
+            issues.append(
+                E_UNEXPECTED_CONTROL_CHARACTER.make(
+                    control_chars=", ".join(repr(c) for c in control_chars)
+                ).at(file, line=line_nr)
+            )
+
+        if invisible_chars:
+            # Report all invisible characters found in the line
+            issues.append(
+                E_UNICODE_INVISIBLE.make(
+                    invisible_chars=", ".join(repr(c) for c in invisible_chars)
+                ).at(file, line=line_nr)
+            )
@@ -1,8 +1,8 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import dataclasses
 from dataclasses import dataclass
 from enum import Enum
-from collections import OrderedDict
+from functools import lru_cache
 
 import re
 
@@ -31,13 +31,51 @@ class OwnershipType(Enum):
 ################################################################################
 
 
-@dataclass
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)(\+dev-SNAPSHOT)?")
+
+
+@lru_cache(maxsize=4096)
+def _parse_version_str(value: str) -> Optional[Tuple[int, int, int, bool]]:
+    """
+    Parses the (major, minor, patch, is_dev) parts of a version string, or
+    returns None if it is not a version. The same version strings recur across
+    a config, so the results are cached; Version instances are built per call.
+    """
+    # Fast path for the plain "N.N.N" and "N.N.N+dev-SNAPSHOT" forms
+    rest, plus, suffix = value.partition("+")
+    if not plus or suffix == "dev-SNAPSHOT":
+        major, _, rest = rest.partition(".")
+        minor, _, patch = rest.partition(".")
+        if major.isdecimal() and minor.isdecimal() and patch.isdecimal():
+            return int(major), int(minor), int(patch), bool(plus)
+
+    # Anything else (e.g. trailing qualifiers) goes through the regex
+    match = _VERSION_RE.match(value)
+    if not match:
+        return None
+
+    major, minor, patch, is_dev = match.groups()
+    return int(major), int(minor), int(patch), bool(is_dev)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Version:
     raw: Quoted[SStr] | None
     major: int
     minor: int
     patch: int
     is_dev: bool
+    # Comparison key, computed once since versions are compared a lot when sorting
+    _key: Tuple[int, int, int, int] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_key",
+            (self.major, self.minor, self.patch, 1 if self.is_dev else 0),
+        )
 
     def __str__(self) -> str:
         return f"{self.major}.{self.minor}.{self.patch}" + (
@@ -56,12 +94,11 @@ class Version:
     @classmethod
     def parse_or_null(cls, version: Quoted[SStr] | str) -> Union["Version", None]:
         value = version.value.value if isinstance(version, Quoted) else version
-        match = re.match(r"(\d+)\.(\d+)\.(\d+)(\+dev-SNAPSHOT)?", value)
-        if not match:
+        parts = _parse_version_str(value)
+        if parts is None:
             return None
 
-        major, minor, patch, is_dev = match.groups()
-        return cls(version, int(major), int(minor), int(patch), bool(is_dev))
+        return cls(version, *parts)
 
     @classmethod
     def parse(cls, version: Quoted[SStr] | str) -> "Version":
@@ -72,24 +109,15 @@ class Version:
         return result
 
     def __lt__(self, other: "Version") -> bool:
-        self_dev_val = 1 if self.is_dev else 0
-        other_dev_val = 1 if other.is_dev else 0
-        return (self.major, self.minor, self.patch, self_dev_val) < (
-            other.major,
-            other.minor,
-            other.patch,
-            other_dev_val,
-        )
+        return self._key < other._key
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Version):
             return NotImplemented
-        return (self.major, self.minor, self.patch, self.is_dev) == (
-            other.major,
-            other.minor,
-            other.patch,
-            other.is_dev,
-        )
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def __gt__(self, other: "Version") -> bool:
         return other < self
@@ -154,6 +182,27 @@ class JvmScalaLibrary(Feature):
         return [Scala(), Jvm()]
 
 
+def _resolve_jar_names(
+    jar_name: Optional[str],
+    shaded_jar_name: Optional[str],
+    unshaded_jar_name: Optional[str],
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Completes the (jar, shaded, unshaded) jar names of a Kotlin application or
+    agent from the first one given. The plain jar is the shaded one.
+    """
+    given = jar_name or shaded_jar_name or unshaded_jar_name
+    if not given:
+        return jar_name, shaded_jar_name, unshaded_jar_name
+
+    assert isinstance(given, str), f"Expected string, got {type(given)}"
+    assert given.endswith(".jar"), f"Expected .jar file, got {given}"
+    base = given[: -len(".jar")]
+    if jar_name or shaded_jar_name:
+        return given, given, f"{base}-unshaded.jar"
+    return given, f"{base}-shaded.jar", given
+
+
 @dataclass
 class JvmKotlinApplication(Feature):
     __feature_name__ = "jvm-kotlin-application"
@@ -163,36 +212,9 @@ class JvmKotlinApplication(Feature):
     unshadedJarName: Optional[str] = None
 
     def __post_init__(self):
-        if self.jarName:
-            assert isinstance(
-                self.jarName, str
-            ), f"Expected string, got {type(self.jarName)}"
-            assert self.jarName.endswith(
-                ".jar"
-            ), f"Expected .jar file, got {self.jarName}"
-            base, _ = os.path.splitext(self.jarName)
-            self.shadedJarName = self.jarName
-            self.unshadedJarName = f"{base}-unshaded.jar"
-        elif self.shadedJarName:
-            assert isinstance(
-                self.shadedJarName, str
-            ), f"Expected string, got {type(self.shadedJarName)}"
-            assert self.shadedJarName.endswith(
-                ".jar"
-            ), f"Expected .jar file, got {self.shadedJarName}"
-            base, _ = os.path.splitext(self.shadedJarName)
-            self.jarName = self.shadedJarName
-            self.unshadedJarName = f"{base}-unshaded.jar"
-        elif self.unshadedJarName:
-            assert isinstance(
-                self.unshadedJarName, str
-            ), f"Expected string, got {type(self.unshadedJarName)}"
-            assert self.unshadedJarName.endswith(
-                ".jar"
-            ), f"Expected .jar file, got {self.unshadedJarName}"
-            base, _ = os.path.splitext(self.unshadedJarName)
-            self.jarName = self.unshadedJarName
-            self.shadedJarName = f"{base}-shaded.jar"
+        self.jarName, self.shadedJarName, self.unshadedJarName = _resolve_jar_names(
+            self.jarName, self.shadedJarName, self.unshadedJarName
+        )
 
     def implied(self) -> List[Feature]:
         return [
@@ -226,36 +248,9 @@ class JvmKotlinAgent(Feature):
     unshadedJarName: Optional[str] = None
 
     def __post_init__(self):
-        if self.jarName:
-            assert isinstance(
-                self.jarName, str
-            ), f"Expected string, got {type(self.jarName)}"
-            assert self.jarName.endswith(
-                ".jar"
-            ), f"Expected .jar file, got {self.jarName}"
-            base, _ = os.path.splitext(self.jarName)
-            self.shadedJarName = self.jarName
-            self.unshadedJarName = f"{base}-unshaded.jar"
-        elif self.shadedJarName:
-            assert isinstance(
-                self.shadedJarName, str
-            ), f"Expected string, got {type(self.shadedJarName)}"
-            assert self.shadedJarName.endswith(
-                ".jar"
-            ), f"Expected .jar file, got {self.shadedJarName}"
-            base, _ = os.path.splitext(self.shadedJarName)
-            self.jarName = self.shadedJarName
-            self.unshadedJarName = f"{base}-unshaded.jar"
-        elif self.unshadedJarName:
-            assert isinstance(
-                self.unshadedJarName, str
-            ), f"Expected string, got {type(self.unshadedJarName)}"
-            assert self.unshadedJarName.endswith(
-                ".jar"
-            ), f"Expected .jar file, got {self.unshadedJarName}"
-            base, _ = os.path.splitext(self.unshadedJarName)
-            self.jarName = self.unshadedJarName
-            self.shadedJarName = f"{base}-shaded.jar"
+        self.jarName, self.shadedJarName, self.unshadedJarName = _resolve_jar_names(
+            self.jarName, self.shadedJarName, self.unshadedJarName
+        )
 
     def implied(self) -> List[Feature]:
         return [
@@ -278,20 +273,20 @@ class KotlinSerialization(Feature):
 ################################################################################
 
 
-@dataclass
+@dataclass(slots=True)
 class KotlinPluginDefinition:
     name: str
     version: str
     repo: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MavenRepositoryDefinition:
     name: str
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MavenLibraryDefinition:
     name: str
     maven_urn: MavenCoordinate
@@ -314,7 +309,10 @@ class GradleDependencyScope(Enum):
     TEST_RUNTIME_ONLY = "testRuntimeOnly"
 
 
-@dataclass
+_VALID_SCOPES = frozenset(scope.value for scope in GradleDependencyScope)
+
+
+@dataclass(slots=True)
 class Dependency:
     scope: str | None
     target: "DependencyTarget"
@@ -341,9 +339,6 @@ class Dependency:
             self.target, DependencyTarget
         ), f"Expected DependencyTarget, got {type(self.target)}"
 
-    def __str__(self):
-        return self.as_string()
-
     def as_string(self):
         modifier = self.scope
         if modifier is None:
@@ -361,14 +356,18 @@ class Dependency:
                 # FIXME: repo is not used
                 return f'{modifier}("{artifact}")'
 
+    __str__ = as_string
+
 
 class DependencyTarget:
+    __slots__ = ()
+
     JarFile: type["JarFileDependencyTarget"] = None  # type: ignore
     Project: type["ProjectDependencyTarget"] = None  # type: ignore
     Maven: type["MavenDependencyTarget"] = None  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class JarFileDependencyTarget(DependencyTarget):
     path: Path
 
@@ -376,7 +375,7 @@ class JarFileDependencyTarget(DependencyTarget):
 DependencyTarget.JarFile = JarFileDependencyTarget
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectDependencyTarget(DependencyTarget):
     project: str
 
@@ -384,7 +383,7 @@ class ProjectDependencyTarget(DependencyTarget):
 DependencyTarget.Project = ProjectDependencyTarget
 
 
-@dataclass
+@dataclass(slots=True)
 class MavenDependencyTarget(DependencyTarget):
     maven_repo: str | None = None
     artifact: str | None = None
@@ -416,7 +415,7 @@ class Project:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PythonDependency:
     """
     Simple container for Python dependency info: name, version spec, optional extras,
@@ -615,21 +614,15 @@ class Config:
     default_git_user_email: str | None = None
     default_git_user_name: str | None = None
 
-    repositories: OrderedDict[str, MavenRepositoryDefinition] = dataclasses.field(
-        default_factory=OrderedDict
-    )
-    plugins: OrderedDict[str, KotlinPluginDefinition] = dataclasses.field(
-        default_factory=OrderedDict
+    repositories: Dict[str, MavenRepositoryDefinition] = dataclasses.field(
+        default_factory=dict
     )
-    libraries: OrderedDict[str, MavenLibraryDefinition] = dataclasses.field(
-        default_factory=OrderedDict
-    )
-    library_groups: OrderedDict[str, List[str]] = dataclasses.field(
-        default_factory=OrderedDict
-    )
-    defined_projects: OrderedDict[str, Project] = dataclasses.field(
-        default_factory=OrderedDict
+    plugins: Dict[str, KotlinPluginDefinition] = dataclasses.field(default_factory=dict)
+    libraries: Dict[str, MavenLibraryDefinition] = dataclasses.field(
+        default_factory=dict
     )
+    library_groups: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
+    defined_projects: Dict[str, Project] = dataclasses.field(default_factory=dict)
 
 
 def load_config() -> Config:
@@ -647,9 +640,10 @@ def load_config() -> Config:
 
     @ctx.register(name="define")
     def define(name: Quoted[SAtom], value: Any):
-        assert isinstance(name.value, SAtom), f"Expected atom, got {type(name)}"
-        # print(f"Defined {name.value} as {value}")
-        ctx.env[name.value.value] = value
+        atom = name.value
+        assert isinstance(atom, SAtom), f"Expected atom, got {type(name)}"
+        # print(f"Defined {atom} as {value}")
+        ctx.env[atom.value] = value
 
     @ctx.register(name="openai-key")
     def openai_key(key: str):
@@ -730,12 +724,11 @@ def load_config() -> Config:
     def library(name: str, maven_urn: str, repo: str | None = None) -> None:
         assert isinstance(name, str), f"Expected string, got {type(name)}"
         assert isinstance(maven_urn, str), f"Expected string, got {type(maven_urn)}"
-        assert is_valid_maven_coordinate(
-            maven_urn
-        ), f"Invalid Maven coordinate: {maven_urn}"
+        coord = MavenCoordinate.parse_or_null(maven_urn)
+        assert coord is not None, f"Invalid Maven coordinate: {maven_urn}"
         assert name not in config.libraries, f"Library {name} already exists"
-        coord = MavenCoordinate.parse(maven_urn)
         config.libraries[name] = MavenLibraryDefinition(name, coord, repo)
+        resolved_deps.clear()
 
     @ctx.register(name="define-maven-library-group")
     def library_group(
@@ -747,10 +740,13 @@ def load_config() -> Config:
             children, list
         ), f"Expected list of libraries, got {type(children)}"
         # assert all(isinstance(lib, str) or isinstance(lib, Dependency) for lib in children), f"Expected list of strings, got {children}"
-        assert all(
-            lib in children for lib in children
-        ), f"Unknown libraries: {children}"
         config.library_groups[name] = children
+        resolved_deps.clear()
+
+    # Dependencies resolved from library and library group names, by
+    # (name, modifier). Groups are expanded for every project that uses them,
+    # so they are resolved once; defining a library or group clears this.
+    resolved_deps: Dict[Tuple[str, str | None], Tuple[Dependency, ...]] = {}
 
     def parse_gradle_dependency(
         dep: str | Dependency, modifier: str | None = None
@@ -772,16 +768,11 @@ def load_config() -> Config:
         assert isinstance(dep, str), f"Expected string or Dependency, got {type(dep)}"
 
         if modifier is not None:
-            assert modifier in [
-                "test",
-                "implementation",
-                "api",
-                "compileOnly",
-                "runtimeOnly",
-                "testImplementation",
-                "testCompileOnly",
-                "testRuntimeOnly",
-            ], f"Unknown modifier: {modifier}"
+            assert modifier in _VALID_SCOPES, f"Unknown modifier: {modifier}"
+
+        cached = resolved_deps.get((dep, modifier))
+        if cached is not None:
+            return list(cached)
 
         if dep.startswith(".") or dep.startswith("/"):
             path = Path(dep)
@@ -806,12 +797,13 @@ def load_config() -> Config:
             result = []
             for lib in config.library_groups[dep]:
                 result.extend(parse_gradle_dependency(lib, modifier))
+            resolved_deps[(dep, modifier)] = tuple(result)
             return result
 
         if dep in config.libraries:
             maven_urn = config.libraries[dep].maven_urn.__str__()
             maven_repo = config.libraries[dep].repo
-            return [
+            result = [
                 Dependency(
                     scope=modifier,
                     target=MavenDependencyTarget(
@@ -819,6 +811,8 @@ def load_config() -> Config:
                     ),
                 )
             ]
+            resolved_deps[(dep, modifier)] = tuple(result)
+            return result
 
         if is_valid_maven_coordinate(dep):
             return [
@@ -831,62 +825,57 @@ def load_config() -> Config:
     def dep(name: str, modifier: str | None = None) -> List[Dependency]:
         if modifier is not None:
             assert isinstance(modifier, str), f"Expected string, got {type(modifier)}"
-            assert modifier in [
-                "test",
-                "implementation",
-                "api",
-                "compileOnly",
-                "runtimeOnly",
-                "testImplementation",
-                "testCompileOnly",
-                "testRuntimeOnly",
-            ], f"Unknown modifier: {modifier}"
+            assert modifier in _VALID_SCOPES, f"Unknown modifier: {modifier}"
         return parse_gradle_dependency(name, modifier)
 
     ###############################################################################################
     # Projects
     ###############################################################################################
 
-    def verify_project(project: Project) -> None:
-        def is_publishable(project: Project) -> bool:
-            return (
-                project.publish
-                and project.github_repo is not None
-                and (not project.quarantine)
-            )
+    def is_publishable(project: Project) -> bool:
+        return (
+            project.publish
+            and project.github_repo is not None
+            and (not project.quarantine)
+        )
 
+    def verify_dependency(project: Project, dep_project: Project) -> None:
+        assert is_publishable(dep_project), (
+            f"Project {project.name} depends on {dep_project.name}. "
+            f"Project {dep_project.name} is not publishable, but {project.name} is publishable. "
+            f"{project.name}.github_repo = {project.github_repo}, "
+            f"{dep_project.name}.github_repo = {dep_project.github_repo}, "
+            f"{project.name}.quarantine = {project.quarantine}, "
+            f"{dep_project.name}.quarantine = {dep_project.quarantine}"
+            f"{project.name}.publish = {project.publish}, "
+            f"{dep_project.name}.publish = {dep_project.publish}"
+        )
+
+    def verify_project(project: Project) -> None:
         # Verify that IF there is a github_repo (project is publishable),
         # then ALL projects in the dependency chain are also publishable.
+        if not is_publishable(project):
+            return
+
         for dep in project.resolved_dependencies:
             if isinstance(dep.target, ProjectDependencyTarget):
-                dep_project = config.defined_projects[dep.target.project]
-                if is_publishable(project):
-                    assert is_publishable(dep_project), (
-                        f"Project {project.name} depends on {dep_project.name}. "
-                        f"Project {dep_project.name} is not publishable, but {project.name} is publishable. "
-                        f"{project.name}.github_repo = {project.github_repo}, "
-                        f"{dep_project.name}.github_repo = {dep_project.github_repo}, "
-                        f"{project.name}.quarantine = {project.quarantine}, "
-                        f"{dep_project.name}.quarantine = {dep_project.quarantine}"
-                        f"{project.name}.publish = {project.publish}, "
-                        f"{dep_project.name}.publish = {dep_project.publish}"
-                    )
+                verify_dependency(project, config.defined_projects[dep.target.project])
 
-    @ctx.register(name="python")
-    def python_project(
+    def simple_project(
+        project_cls: type,
         dir_name: str,
         version: Quoted[SStr],
-        name: Optional[str] = None,
-        license: str | None = "AGPL",
-        quarantine: bool = False,
-        publish: bool = True,
-        repo: str | None = None,
-        ownership: OwnershipType = OwnershipType.WABBIT,
+        name: Optional[str],
+        license: str | None,
+        quarantine: bool,
+        publish: bool,
+        repo: str | None,
+        ownership: OwnershipType,
     ) -> None:
-        path = Path(f"./{dir_name}")
+        """Registers a project that has no dependencies of its own."""
         name = name or dir_name
-        project_obj = PythonProject(
-            path=path,
+        project_obj = project_cls(
+            path=Path(f"./{dir_name}"),
             name=name,
             quarantine=quarantine,
             publish=publish,
@@ -899,6 +888,29 @@ def load_config() -> Config:
         verify_project(project_obj)
         config.defined_projects[name] = project_obj
 
+    @ctx.register(name="python")
+    def python_project(
+        dir_name: str,
+        version: Quoted[SStr],
+        name: Optional[str] = None,
+        license: str | None = "AGPL",
+        quarantine: bool = False,
+        publish: bool = True,
+        repo: str | None = None,
+        ownership: OwnershipType = OwnershipType.WABBIT,
+    ) -> None:
+        simple_project(
+            PythonProject,
+            dir_name,
+            version,
+            name,
+            license,
+            quarantine,
+            publish,
+            repo,
+            ownership,
+        )
+
     @ctx.register(name="purescript")
     def purescript_project(
         dir_name: str,
@@ -910,21 +922,17 @@ def load_config() -> Config:
         repo: str | None = None,
         ownership: OwnershipType = OwnershipType.WABBIT,
     ) -> None:
-        path = Path(f"./{dir_name}")
-        name = name or dir_name
-        project_obj = PurescriptProject(
-            path=path,
-            name=name,
-            quarantine=quarantine,
-            license=license,
-            publish=publish,
-            github_repo=repo,
-            ownership=ownership,
-            version=Version.parse(version) if version else None,
-            resolved_dependencies=[],
+        simple_project(
+            PurescriptProject,
+            dir_name,
+            version,
+            name,
+            license,
+            quarantine,
+            publish,
+            repo,
+            ownership,
         )
-        verify_project(project_obj)
-        config.defined_projects[name] = project_obj
 
     @ctx.register(name="data")
     def data_project(
@@ -937,21 +945,17 @@ def load_config() -> Config:
         repo: str | None = None,
         ownership: OwnershipType = OwnershipType.WABBIT,
     ) -> None:
-        path = Path(f"./{dir_name}")
-        name = name or dir_name
-        project_obj = DataProject(
-            path=path,
-            name=name,
-            quarantine=quarantine,
-            publish=publish,
-            license=license,
-            github_repo=repo,
-            ownership=ownership,
-            version=Version.parse(version) if version else None,
-            resolved_dependencies=[],
+        simple_project(
+            DataProject,
+            dir_name,
+            version,
+            name,
+            license,
+            quarantine,
+            publish,
+            repo,
+            ownership,
         )
-        verify_project(project_obj)
-        config.defined_projects[name] = project_obj
 
     @ctx.register(name="premake")
     def premake_project(
@@ -964,21 +968,17 @@ def load_config() -> Config:
         repo: str | None = None,
         ownership: OwnershipType = OwnershipType.WABBIT,
     ) -> None:
-        path = Path(f"./{dir_name}")
-        name = name or dir_name
-        project_obj = PremakeProject(
-            path=path,
-            name=name,
-            github_repo=repo,
-            license=license,
-            quarantine=quarantine,
-            publish=publish,
-            ownership=ownership,
-            version=Version.parse(version) if version else None,
-            resolved_dependencies=[],
+        simple_project(
+            PremakeProject,
+            dir_name,
+            version,
+            name,
+            license,
+            quarantine,
+            publish,
+            repo,
+            ownership,
         )
-        verify_project(project_obj)
-        config.defined_projects[name] = project_obj
 
     @ctx.register(name="gradle")
     def gradle_project(
@@ -1009,12 +1009,11 @@ def load_config() -> Config:
         for feature in list(resolved_features.values()):
             for implied in feature.implied():
                 implied_name = type(implied).__feature_name__
-                if implied_name not in resolved_features:
-                    resolved_features[implied_name] = implied
-                else:
+                existing = resolved_features.setdefault(implied_name, implied)
+                if existing is not implied:
                     assert (
-                        resolved_features[implied_name] == implied
-                    ), f"Implied feature {implied_name} is already defined with a different configuration {resolved_features[implied_name]} != {implied} for {name}"
+                        existing == implied
+                    ), f"Implied feature {implied_name} is already defined with a different configuration {existing} != {implied} for {name}"
 
         raw_dependencies: List[str | DependencyTarget | List[DependencyTarget]] = (
             dependencies or []
@@ -1031,12 +1030,22 @@ def load_config() -> Config:
                 ), f"Expected string or Dependency, got {type(dep)}"
                 resolved_dependencies.append(dep)
 
+        # One pass over the dependencies: collect the Maven repositories and,
+        # for publishable projects, the project dependencies to verify (see
+        # verify_project)
+        publishable = publish and repo is not None and not quarantine
         maven_repositories: List[MavenRepositoryDefinition] = []
+        dep_projects: List[Project] = []
+        seen_repo_names: Set[str] = set()
         for dep in resolved_dependencies:
-            if isinstance(dep.target, MavenDependencyTarget) and dep.target.maven_repo:
-                maven_repo = config.repositories[dep.target.maven_repo]
-                if maven_repo not in maven_repositories:
-                    maven_repositories.append(maven_repo)
+            target = dep.target
+            if isinstance(target, MavenDependencyTarget):
+                repo_name = target.maven_repo
+                if repo_name and repo_name not in seen_repo_names:
+                    seen_repo_names.add(repo_name)
+                    maven_repositories.append(config.repositories[repo_name])
+            elif publishable and isinstance(target, ProjectDependencyTarget):
+                dep_projects.append(config.defined_projects[target.project])
 
         project_obj = GradleProject(
             path=Path(f"./{dir_name}"),
@@ -1055,7 +1064,8 @@ def load_config() -> Config:
             ownership=ownership,
         )
 
-        verify_project(project_obj)
+        for dep_project in dep_projects:
+            verify_dependency(project_obj, dep_project)
 
         config.defined_projects[name] = project_obj
 
@@ -1,97 +1,226 @@
+import asyncio
+import logging
 import os
+import shutil
+import stat
+import tempfile
+from contextlib import contextmanager, suppress
+from email.utils import formatdate, parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import aiohttp
 import requests
-import time
-import dateparser
-
-
-def save_uri(uri, path):
-    needs_download = True
-
-    if os.path.exists(path):
-        if os.path.isdir(path):
-            raise Exception(f"{path} is a directory.")
-
-        # Get the old modification time.
-        old_mtime = os.path.getmtime(path)
-        print(f"Old file modification time: {old_mtime}")
-
-        # Get the old ETag.
-        old_etag = None
-        if os.path.exists(path + ".etag"):
-            if os.path.isdir(path + ".etag"):
-                print(f"{path + '.etag'} is a directory.")
-            else:
-                with open(path + ".etag", "rt") as fin:
-                    old_etag = fin.read().strip()
-                print(f"Old ETag: {old_etag}")
-
-        head_mtime = None
-        head_etag = None
-        head_status = None
-
-        try:
-            response = requests.head(
-                uri,
-                headers={
-                    "If-Modified-Since": time.strftime(
-                        "%a, %d %b %Y %H:%M:%S GMT", time.gmtime(old_mtime)
-                    )
-                },
-            )
-
-            head_status = response.status_code
-
-            # Parse Last-Modified if it exists
-            head_mtime = response.headers.get("Last-Modified", None)
-            if head_mtime is not None:
-                head_mtime = dateparser.parse(head_mtime)
-                head_mtime = time.mktime(head_mtime.timetuple())
-                print(f"Last modification time: {head_mtime}")
-
-            head_etag = response.headers.get("ETag", None)
-            if head_etag is not None:
-                head_etag = head_etag.strip()
-                print(f"New ETag: {head_etag}")
-        except Exception as e:
-            print(e)
-            print("Failed to query HEAD.")
-
-        if head_status == 304:
-            print("Server responded with 304.")
-            needs_download = False
+from requests.adapters import HTTPAdapter
 
-        if head_etag == old_etag:
-            print("Same ETag.")
-            needs_download = False
+logger = logging.getLogger(__name__)
 
-        if head_mtime == old_mtime or (
-            head_mtime is not None and head_mtime <= old_mtime
-        ):
-            print("Modified at an earlier date.")
-            needs_download = False
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # 64 KB
 
-        if head_etag is not None and head_etag != old_etag:
-            with open(path + ".etag", "wt+") as fout:
-                fout.write(head_etag)
+# Read once at import; os.umask can only be queried by setting it, which is
+# not safe while download threads are running.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
-    if not needs_download:
-        print(f"No need to download {uri} to {path}.")
-        return
+# Shared by all downloads so that requests to the same host reuse connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+
+@contextmanager
+def _open_atomic(path, mode):
+    """
+    Writes to a temporary file next to ``path`` and moves it over ``path`` only
+    once the block completes, so an interrupted download never leaves a
+    truncated file or ETag behind. An existing file keeps its permission bits.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}."
+    )
+    try:
+        with os.fdopen(fd, mode) as fout:
+            yield fout
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            # mkstemp creates 0600; give new downloads the usual default
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _read_local_validators(path):
+    """
+    Returns ``(old_mtime, old_etag)`` for an existing download at ``path``,
+    or ``(None, None)`` if it has not been downloaded yet.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None, None
+
+    if stat.S_ISDIR(st.st_mode):
+        raise Exception(f"{path} is a directory.")
 
-    print(f"Downloading {uri} to {path}.")
-    response = requests.get(uri)
-    assert response.status_code == 200
-    with open(path, "wt+") as fout:
-        fout.write(response.text)
+    # Get the old modification time.
+    old_mtime = st.st_mtime
+    logger.debug("Old file modification time: %s", old_mtime)
 
+    # Get the old ETag.
+    old_etag = None
     try:
-        last_modified = response.headers.get("Last-Modified", None)
+        with open(path + ".etag", "rt") as fin:
+            old_etag = fin.read().strip()
+        logger.debug("Old ETag: %s", old_etag)
+    except FileNotFoundError:
+        pass
+    except IsADirectoryError:
+        logger.warning("%s.etag is a directory.", path)
+
+    return old_mtime, old_etag
+
+
+def _conditional_headers(old_mtime, old_etag):
+    headers = {}
+    if old_mtime is not None:
+        headers["If-Modified-Since"] = formatdate(old_mtime, usegmt=True)
+    if old_etag:
+        headers["If-None-Match"] = old_etag
+    return headers
+
+
+def _check_response(status, response_headers, old_mtime, old_etag):
+    """
+    Returns ``(needs_download, new_etag, last_modified)`` for a response to
+    the conditional GET.
+    """
+    if status == 304:
+        logger.debug("Server responded with 304.")
+        needs_download = False
+    else:
+        assert status == 200
+        needs_download = True
+
+    new_etag = response_headers.get("ETag", None)
+    if new_etag is not None:
+        new_etag = new_etag.strip()
+        logger.debug("New ETag: %s", new_etag)
+
+    last_modified = None
+    try:
+        last_modified = response_headers.get("Last-Modified", None)
         if last_modified is not None:
-            last_modified = dateparser.parse(last_modified)
-            last_modified = time.mktime(last_modified.timetuple())
+            last_modified = parsedate_to_datetime(last_modified).timestamp()
+            logger.debug("Last modification time: %s", last_modified)
     except Exception as e:
-        print(e)
-        print("Could not get last-modified date.")
+        last_modified = None
+        logger.warning("Could not get last-modified date: %s", e)
+
+    # Servers that ignore conditional headers still answer 200, so fall
+    # back to comparing the validators ourselves before reading the body.
+    # An ETag is authoritative (RFC 7232); the date only decides without one.
+    if needs_download and old_mtime is not None:
+        if new_etag is not None:
+            if new_etag == old_etag:
+                logger.debug("Same ETag.")
+                needs_download = False
+        elif last_modified is not None and last_modified <= old_mtime:
+            logger.debug("Modified at an earlier date.")
+            needs_download = False
+
+    return needs_download, new_etag, last_modified
+
+
+def _finish_download(path, downloaded, old_etag, new_etag, last_modified):
+    # Validators are only recorded for a body that was actually written.
+    if not downloaded:
+        return
+
+    if new_etag is not None and new_etag != old_etag:
+        with _open_atomic(path + ".etag", "wt") as fout:
+            fout.write(new_etag)
 
     if last_modified is not None:
         os.utime(path, (last_modified, last_modified))
+
+
+def save_uri(uri, path, session=None):
+    session = session or _SESSION
+    old_mtime, old_etag = _read_local_validators(path)
+    headers = _conditional_headers(old_mtime, old_etag)
+
+    # A single conditional GET: the server answers 304 when our copy is
+    # current, so there is no separate HEAD round-trip.
+    with session.get(uri, headers=headers, stream=True) as response:
+        needs_download, new_etag, last_modified = _check_response(
+            response.status_code, response.headers, old_mtime, old_etag
+        )
+
+        if needs_download:
+            logger.info("Downloading %s to %s.", uri, path)
+            with _open_atomic(path, "wb") as fout:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    fout.write(chunk)
+        else:
+            logger.debug("No need to download %s to %s.", uri, path)
+
+    _finish_download(path, needs_download, old_etag, new_etag, last_modified)
+
+
+async def save_uri_async(session, uri, path):
+    """
+    Same as ``save_uri``, but over an ``aiohttp.ClientSession`` so that many
+    downloads can share one event loop.
+    """
+    old_mtime, old_etag = _read_local_validators(path)
+    headers = _conditional_headers(old_mtime, old_etag)
+
+    async with session.get(uri, headers=headers) as response:
+        needs_download, new_etag, last_modified = _check_response(
+            response.status, response.headers, old_mtime, old_etag
+        )
+
+        if needs_download:
+            logger.info("Downloading %s to %s.", uri, path)
+            # Local writes of one chunk are short enough to do inline.
+            with _open_atomic(path, "wb") as fout:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    fout.write(chunk)
+        else:
+            logger.debug("No need to download %s to %s.", uri, path)
+
+    _finish_download(path, needs_download, old_etag, new_etag, last_modified)
+
+
+def save_uris(pairs, max_workers=8, session=None):
+    """
+    Downloads each ``(uri, path)`` pair with ``save_uri`` on a thread pool.
+
+    Keep ``max_workers`` at or below the session's connection pool size, and
+    lower it for servers that rate-limit concurrent requests.
+    """
+    session = session or _SESSION
+    pairs = list(pairs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(save_uri, uri, path, session=session): uri
+            for uri, path in pairs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            future.result()
+            logger.debug("Finished %s (%d/%d).", futures[future], done, len(pairs))
+
+
+async def save_uris_async(pairs, max_connections=64):
+    """
+    Downloads each ``(uri, path)`` pair concurrently on the running event
+    loop, with at most ``max_connections`` connections open at once.
+    """
+    connector = aiohttp.TCPConnector(limit=max_connections)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(
+            *(save_uri_async(session, uri, path) for uri, path in pairs)
+        )
@@ -1,12 +1,13 @@
 from __future__ import annotations
 from typing import List, Tuple, Optional, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 import os
 import stat
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class ExpectedFileProperties:
     is_executable: bool = False
     is_plain_text: bool = False
@@ -16,10 +17,32 @@ class ExpectedFileProperties:
     is_security_sensitive: bool = False  # Added this flag
     is_crlf_native: bool = False  # Added this flag
 
-    @property
-    def is_text(self) -> bool:
+    is_text: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
         # Text includes plain text, structured config, and code
-        return self.is_plain_text or self.is_configuration or self.is_code
+        object.__setattr__(
+            self, "is_text", self.is_plain_text or self.is_configuration or self.is_code
+        )
+
+
+# Shared instances for the tables below; the properties are immutable, so
+# every entry with the same flags can point at the same object.
+_PLAIN_TEXT = ExpectedFileProperties(is_plain_text=True)
+_CONFIGURATION = ExpectedFileProperties(is_configuration=True)
+_CODE = ExpectedFileProperties(is_code=True)
+_BINARY = ExpectedFileProperties(is_binary=True)
+_SENSITIVE_PLAIN_TEXT = ExpectedFileProperties(
+    is_plain_text=True, is_security_sensitive=True
+)
+_SENSITIVE_CONFIGURATION = ExpectedFileProperties(
+    is_configuration=True, is_security_sensitive=True
+)
+_SENSITIVE_BINARY = ExpectedFileProperties(is_binary=True, is_security_sensitive=True)
+_EXECUTABLE_BINARY = ExpectedFileProperties(is_binary=True, is_executable=True)
+_WINDOWS_SCRIPT = ExpectedFileProperties(
+    is_code=True, is_executable=True, is_crlf_native=True
+)
 
 
 # ============================================================
@@ -27,146 +50,99 @@ class ExpectedFileProperties:
 # ============================================================
 PROPERTIES_BY_NAME: Dict[str, ExpectedFileProperties] = {
     # -- Common Project Metadata --
-    "README": ExpectedFileProperties(is_plain_text=True),
-    "LICENSE": ExpectedFileProperties(is_plain_text=True),
-    "COPYING": ExpectedFileProperties(is_plain_text=True),
-    "CHANGELOG": ExpectedFileProperties(is_plain_text=True),
-    "CONTRIBUTING": ExpectedFileProperties(is_plain_text=True),
-    "AUTHORS": ExpectedFileProperties(is_plain_text=True),
-    "TODO": ExpectedFileProperties(is_plain_text=True),
-    "HISTORY": ExpectedFileProperties(is_plain_text=True),
-    "NEWS": ExpectedFileProperties(is_plain_text=True),
-    "UPGRADE": ExpectedFileProperties(is_plain_text=True),
-    "UPGRADING": ExpectedFileProperties(is_plain_text=True),
-    "INSTALL": ExpectedFileProperties(is_plain_text=True),
-    "NOTICE": ExpectedFileProperties(is_plain_text=True),
-    "CODE_OF_CONDUCT": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Often Markdown, but treat as plain text info
+    "README": _PLAIN_TEXT,
+    "LICENSE": _PLAIN_TEXT,
+    "COPYING": _PLAIN_TEXT,
+    "CHANGELOG": _PLAIN_TEXT,
+    "CONTRIBUTING": _PLAIN_TEXT,
+    "AUTHORS": _PLAIN_TEXT,
+    "TODO": _PLAIN_TEXT,
+    "HISTORY": _PLAIN_TEXT,
+    "NEWS": _PLAIN_TEXT,
+    "UPGRADE": _PLAIN_TEXT,
+    "UPGRADING": _PLAIN_TEXT,
+    "INSTALL": _PLAIN_TEXT,
+    "NOTICE": _PLAIN_TEXT,
+    "CODE_OF_CONDUCT": _PLAIN_TEXT,  # Often Markdown, but treat as plain text info
     # -- Build & Task Runners --
-    "Makefile": ExpectedFileProperties(is_code=True),  # Makefile syntax is code-like
-    "makefile": ExpectedFileProperties(is_code=True),
-    "GNUmakefile": ExpectedFileProperties(is_code=True),
-    "Rakefile": ExpectedFileProperties(is_code=True),  # Ruby code
-    "Gemfile": ExpectedFileProperties(is_configuration=True),  # Ruby DSL for deps
-    "Podfile": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Ruby DSL for CocoaPods deps
-    "Gruntfile.js": ExpectedFileProperties(is_code=True),  # JS Code
-    "gulpfile.js": ExpectedFileProperties(is_code=True),  # JS Code
+    "Makefile": _CODE,  # Makefile syntax is code-like
+    "makefile": _CODE,
+    "GNUmakefile": _CODE,
+    "Rakefile": _CODE,  # Ruby code
+    "Gemfile": _CONFIGURATION,  # Ruby DSL for deps
+    "Podfile": _CONFIGURATION,  # Ruby DSL for CocoaPods deps
+    "Gruntfile.js": _CODE,  # JS Code
+    "gulpfile.js": _CODE,  # JS Code
+    "CMakeLists.txt": _CODE,  # CMake script
     # -- Containerization --
-    "Dockerfile": ExpectedFileProperties(
-        is_code=True
-    ),  # Dockerfile syntax is code-like
-    "dockerfile": ExpectedFileProperties(is_code=True),
-    ".dockerignore": ExpectedFileProperties(is_configuration=True),
-    "compose.yaml": ExpectedFileProperties(is_configuration=True),  # Docker Compose
-    "compose.yml": ExpectedFileProperties(is_configuration=True),  # Docker Compose
+    "Dockerfile": _CODE,  # Dockerfile syntax is code-like
+    "dockerfile": _CODE,
+    ".dockerignore": _CONFIGURATION,
+    "compose.yaml": _CONFIGURATION,  # Docker Compose
+    "compose.yml": _CONFIGURATION,  # Docker Compose
     # -- Version Control & Ignore Files --
-    ".gitignore": ExpectedFileProperties(is_configuration=True),
-    ".gitattributes": ExpectedFileProperties(is_configuration=True),
-    ".gitmodules": ExpectedFileProperties(is_configuration=True),
-    ".gitconfig": ExpectedFileProperties(is_configuration=True),  # Local repo config
-    ".hgignore": ExpectedFileProperties(is_configuration=True),
-    ".hgsub": ExpectedFileProperties(is_configuration=True),
-    ".hgsubstate": ExpectedFileProperties(is_configuration=True),
-    ".svnignore": ExpectedFileProperties(
-        is_configuration=True
-    ),  # SVN specific property name, less common
-    ".npmignore": ExpectedFileProperties(is_configuration=True),
-    ".eslintignore": ExpectedFileProperties(is_configuration=True),
-    ".prettierignore": ExpectedFileProperties(is_configuration=True),
-    ".pylintrc": ExpectedFileProperties(is_configuration=True),  # Ini format
-    ".flake8": ExpectedFileProperties(is_configuration=True),  # Ini format
-    ".editorconfig": ExpectedFileProperties(is_configuration=True),  # Ini format
+    ".gitignore": _CONFIGURATION,
+    ".gitattributes": _CONFIGURATION,
+    ".gitmodules": _CONFIGURATION,
+    ".gitconfig": _CONFIGURATION,  # Local repo config
+    ".hgignore": _CONFIGURATION,
+    ".hgsub": _CONFIGURATION,
+    ".hgsubstate": _CONFIGURATION,
+    ".svnignore": _CONFIGURATION,  # SVN specific property name, less common
+    ".npmignore": _CONFIGURATION,
+    ".eslintignore": _CONFIGURATION,
+    ".prettierignore": _CONFIGURATION,
+    ".pylintrc": _CONFIGURATION,  # Ini format
+    ".flake8": _CONFIGURATION,  # Ini format
+    ".editorconfig": _CONFIGURATION,  # Ini format
     # -- Environment & Secrets (Often security sensitive!) --
-    ".env": ExpectedFileProperties(is_configuration=True, is_security_sensitive=True),
-    ".env.example": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=False
-    ),  # Example, not sensitive
-    ".flaskenv": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=True
-    ),  # Flask specific
-    ".netrc": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=True
-    ),  # FTP/HTTP credentials
-    ".htpasswd": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=True
-    ),  # Apache basic auth users
-    ".htaccess": ExpectedFileProperties(is_configuration=True),  # Apache config
-    "secrets.yaml": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=True
-    ),  # Common convention
-    "secrets.yml": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=True
-    ),  # Common convention
-    "credentials.json": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=True
-    ),  # Common convention
+    ".env": _SENSITIVE_CONFIGURATION,
+    ".env.example": _CONFIGURATION,  # Example, not sensitive
+    ".flaskenv": _SENSITIVE_CONFIGURATION,  # Flask specific
+    ".netrc": _SENSITIVE_CONFIGURATION,  # FTP/HTTP credentials
+    ".htpasswd": _SENSITIVE_PLAIN_TEXT,  # Apache basic auth users
+    ".htaccess": _CONFIGURATION,  # Apache config
+    "secrets.yaml": _SENSITIVE_CONFIGURATION,  # Common convention
+    "secrets.yml": _SENSITIVE_CONFIGURATION,  # Common convention
+    "credentials.json": _SENSITIVE_CONFIGURATION,  # Common convention
     # -- Shell History (Potentially sensitive) --
-    ".bash_history": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=True
-    ),
-    ".zsh_history": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=True
-    ),
-    ".python_history": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=True
-    ),
+    ".bash_history": _SENSITIVE_PLAIN_TEXT,
+    ".zsh_history": _SENSITIVE_PLAIN_TEXT,
+    ".python_history": _SENSITIVE_PLAIN_TEXT,
     # -- Package Management & Dependencies --
-    "package.json": ExpectedFileProperties(is_configuration=True),  # Node.js
-    "package-lock.json": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Node.js lockfile
-    "yarn.lock": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Yarn lockfile (custom format)
-    "composer.json": ExpectedFileProperties(is_configuration=True),  # PHP/Composer
-    "composer.lock": ExpectedFileProperties(
-        is_configuration=True
-    ),  # PHP/Composer lockfile
-    "requirements.txt": ExpectedFileProperties(is_configuration=True),  # Python/pip
-    "Pipfile": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Python/pipenv (TOML format)
-    "Pipfile.lock": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Python/pipenv lockfile (JSON format)
-    "pyproject.toml": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Python build system/deps (TOML)
-    "Cargo.toml": ExpectedFileProperties(is_configuration=True),  # Rust/Cargo (TOML)
-    "Cargo.lock": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Rust/Cargo lockfile (TOML)
-    "go.mod": ExpectedFileProperties(is_configuration=True),  # Go modules
-    "go.sum": ExpectedFileProperties(is_plain_text=True),  # Go module checksums
+    "package.json": _CONFIGURATION,  # Node.js
+    "package-lock.json": _CONFIGURATION,  # Node.js lockfile
+    "yarn.lock": _PLAIN_TEXT,  # Yarn lockfile (custom format)
+    "composer.json": _CONFIGURATION,  # PHP/Composer
+    "composer.lock": _CONFIGURATION,  # PHP/Composer lockfile
+    "requirements.txt": _CONFIGURATION,  # Python/pip
+    "Pipfile": _CONFIGURATION,  # Python/pipenv (TOML format)
+    "Pipfile.lock": _CONFIGURATION,  # Python/pipenv lockfile (JSON format)
+    "pyproject.toml": _CONFIGURATION,  # Python build system/deps (TOML)
+    "Cargo.toml": _CONFIGURATION,  # Rust/Cargo (TOML)
+    "Cargo.lock": _CONFIGURATION,  # Rust/Cargo lockfile (TOML)
+    "go.mod": _CONFIGURATION,  # Go modules
+    "go.sum": _PLAIN_TEXT,  # Go module checksums
     # -- Config Files for Specific Tools --
-    ".babelrc": ExpectedFileProperties(is_configuration=True),  # Babel config (JSON)
-    ".eslintrc": ExpectedFileProperties(
-        is_configuration=True
-    ),  # ESLint config (can be JSON/YAML)
-    ".prettierrc": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Prettier config (can be JSON/YAML/JS)
-    ".stylelintrc": ExpectedFileProperties(is_configuration=True),  # Stylelint config
-    ".travis.yml": ExpectedFileProperties(is_configuration=True),  # Travis CI config
-    ".gitlab-ci.yml": ExpectedFileProperties(is_configuration=True),  # GitLab CI config
-    "Jenkinsfile": ExpectedFileProperties(is_code=True),  # Jenkins pipeline (Groovy)
-    "Vagrantfile": ExpectedFileProperties(is_code=True),  # Vagrant config (Ruby)
-    "Procfile": ExpectedFileProperties(is_configuration=True),  # Heroku process types
-    "now.json": ExpectedFileProperties(is_configuration=True),  # Vercel config (legacy)
-    "vercel.json": ExpectedFileProperties(is_configuration=True),  # Vercel config
-    "netlify.toml": ExpectedFileProperties(is_configuration=True),  # Netlify config
+    ".babelrc": _CONFIGURATION,  # Babel config (JSON)
+    ".eslintrc": _CONFIGURATION,  # ESLint config (can be JSON/YAML)
+    ".prettierrc": _CONFIGURATION,  # Prettier config (can be JSON/YAML/JS)
+    ".stylelintrc": _CONFIGURATION,  # Stylelint config
+    ".travis.yml": _CONFIGURATION,  # Travis CI config
+    ".gitlab-ci.yml": _CONFIGURATION,  # GitLab CI config
+    "Jenkinsfile": _CODE,  # Jenkins pipeline (Groovy)
+    "Vagrantfile": _CODE,  # Vagrant config (Ruby)
+    "Procfile": _CONFIGURATION,  # Heroku process types
+    "now.json": _CONFIGURATION,  # Vercel config (legacy)
+    "vercel.json": _CONFIGURATION,  # Vercel config
+    "netlify.toml": _CONFIGURATION,  # Netlify config
     # -- Misc --
-    ".mailmap": ExpectedFileProperties(is_plain_text=True),  # Git author mapping
-    "robots.txt": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Web crawler instructions
-    "humans.txt": ExpectedFileProperties(is_plain_text=True),  # Site credits
-    "security.txt": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Security policy reporting (RFC 9116)
+    ".mailmap": _PLAIN_TEXT,  # Git author mapping
+    "robots.txt": _PLAIN_TEXT,  # Web crawler instructions
+    "humans.txt": _PLAIN_TEXT,  # Site credits
+    "security.txt": _PLAIN_TEXT,  # Security policy reporting (RFC 9116)
+    ".DS_Store": _BINARY,  # macOS Finder metadata
+    "Thumbs.db": _BINARY,  # Windows Explorer thumbnail cache
 }
 
 # ============================================================
@@ -174,557 +150,410 @@ PROPERTIES_BY_NAME: Dict[str, ExpectedFileProperties] = {
 # ============================================================
 PROPERTIES_BY_EXTENSION: Dict[str, ExpectedFileProperties] = {
     # -- Plain Text & Documentation --
-    ".txt": ExpectedFileProperties(is_plain_text=True),
-    ".md": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Markdown is text, not typically "code" to lint line length strictly
-    ".markdown": ExpectedFileProperties(is_plain_text=True),
-    ".rst": ExpectedFileProperties(is_plain_text=True),  # ReStructuredText
-    ".adoc": ExpectedFileProperties(is_plain_text=True),  # AsciiDoc
-    ".asciidoc": ExpectedFileProperties(is_plain_text=True),  # AsciiDoc
-    ".tex": ExpectedFileProperties(is_plain_text=True),  # LaTeX source
-    ".log": ExpectedFileProperties(is_plain_text=True),
-    ".csv": ExpectedFileProperties(is_plain_text=True),  # Comma Separated Values
-    ".tsv": ExpectedFileProperties(is_plain_text=True),  # Tab Separated Values
-    ".diff": ExpectedFileProperties(is_plain_text=True),  # Diff output
-    ".patch": ExpectedFileProperties(is_plain_text=True),  # Patch file
-    ".po": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Gettext Portable Object (localization)
-    ".pot": ExpectedFileProperties(is_plain_text=True),  # Gettext Template
-    ".srt": ExpectedFileProperties(is_plain_text=True),  # SubRip subtitles
-    ".vtt": ExpectedFileProperties(is_plain_text=True),  # WebVTT subtitles
-    ".bib": ExpectedFileProperties(is_plain_text=True),  # BibTeX bibliography
-    ".ics": ExpectedFileProperties(is_plain_text=True),  # iCalendar
+    ".txt": _PLAIN_TEXT,
+    ".md": _PLAIN_TEXT,  # Markdown is text, not typically "code" to lint line length strictly
+    ".markdown": _PLAIN_TEXT,
+    ".rst": _PLAIN_TEXT,  # ReStructuredText
+    ".adoc": _PLAIN_TEXT,  # AsciiDoc
+    ".asciidoc": _PLAIN_TEXT,  # AsciiDoc
+    ".tex": _PLAIN_TEXT,  # LaTeX source
+    ".log": _PLAIN_TEXT,
+    ".csv": _PLAIN_TEXT,  # Comma Separated Values
+    ".tsv": _PLAIN_TEXT,  # Tab Separated Values
+    ".diff": _PLAIN_TEXT,  # Diff output
+    ".patch": _PLAIN_TEXT,  # Patch file
+    ".po": _PLAIN_TEXT,  # Gettext Portable Object (localization)
+    ".pot": _PLAIN_TEXT,  # Gettext Template
+    ".srt": _PLAIN_TEXT,  # SubRip subtitles
+    ".vtt": _PLAIN_TEXT,  # WebVTT subtitles
+    ".bib": _PLAIN_TEXT,  # BibTeX bibliography
+    ".ics": _PLAIN_TEXT,  # iCalendar
     # -- Configuration Formats --
-    ".json": ExpectedFileProperties(is_configuration=True),
-    ".yaml": ExpectedFileProperties(is_configuration=True),
-    ".yml": ExpectedFileProperties(is_configuration=True),
-    ".xml": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Often config, sometimes data or markup
-    ".toml": ExpectedFileProperties(is_configuration=True),
-    ".ini": ExpectedFileProperties(is_configuration=True),
-    ".cfg": ExpectedFileProperties(is_configuration=True),
-    ".conf": ExpectedFileProperties(is_configuration=True),
-    ".cnf": ExpectedFileProperties(is_configuration=True),  # e.g. MySQL config
-    ".properties": ExpectedFileProperties(is_configuration=True),  # Java properties
-    ".prefs": ExpectedFileProperties(is_configuration=True),
-    ".settings": ExpectedFileProperties(is_configuration=True),
-    ".plist": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Apple Property List (XML or binary)
-    ".xcconfig": ExpectedFileProperties(is_configuration=True),  # Xcode config
-    ".env": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=True
-    ),  # Environment variables
-    ".hcl": ExpectedFileProperties(
-        is_configuration=True
-    ),  # HashiCorp Configuration Language
-    ".tfvars": ExpectedFileProperties(
-        is_configuration=True, is_security_sensitive=True
-    ),  # Terraform variables
+    ".json": _CONFIGURATION,
+    ".yaml": _CONFIGURATION,
+    ".yml": _CONFIGURATION,
+    ".xml": _CONFIGURATION,  # Often config, sometimes data or markup
+    ".toml": _CONFIGURATION,
+    ".ini": _CONFIGURATION,
+    ".cfg": _CONFIGURATION,
+    ".conf": _CONFIGURATION,
+    ".cnf": _CONFIGURATION,  # e.g. MySQL config
+    ".properties": _CONFIGURATION,  # Java properties
+    ".prefs": _CONFIGURATION,
+    ".settings": _CONFIGURATION,
+    ".plist": _CONFIGURATION,  # Apple Property List (XML or binary)
+    ".xcconfig": _CONFIGURATION,  # Xcode config
+    ".env": _SENSITIVE_CONFIGURATION,  # Environment variables
+    ".hcl": _CONFIGURATION,  # HashiCorp Configuration Language
+    ".tfvars": _SENSITIVE_CONFIGURATION,  # Terraform variables
     # -- Web Development --
-    ".html": ExpectedFileProperties(is_code=True),  # Markup is code-like
-    ".htm": ExpectedFileProperties(is_code=True),
-    ".css": ExpectedFileProperties(is_code=True),  # Stylesheets are code
-    ".scss": ExpectedFileProperties(is_code=True),  # SASS/SCSS
-    ".sass": ExpectedFileProperties(is_code=True),  # SASS (indented)
-    ".less": ExpectedFileProperties(is_code=True),  # LESS CSS preprocessor
-    ".styl": ExpectedFileProperties(is_code=True),  # Stylus CSS preprocessor
-    ".js": ExpectedFileProperties(is_code=True),  # JavaScript
-    ".jsx": ExpectedFileProperties(is_code=True),  # JavaScript React/JSX
-    ".mjs": ExpectedFileProperties(is_code=True),  # JavaScript ES Module
-    ".cjs": ExpectedFileProperties(is_code=True),  # JavaScript CommonJS Module
-    ".ts": ExpectedFileProperties(is_code=True),  # TypeScript
-    ".tsx": ExpectedFileProperties(is_code=True),  # TypeScript React/JSX
-    ".vue": ExpectedFileProperties(is_code=True),  # Vue.js Single File Components
-    ".svelte": ExpectedFileProperties(is_code=True),  # Svelte components
-    ".php": ExpectedFileProperties(is_code=True),  # PHP code
-    ".phtml": ExpectedFileProperties(is_code=True),  # PHP templated HTML
-    ".asp": ExpectedFileProperties(is_code=True),  # Classic ASP
-    ".aspx": ExpectedFileProperties(is_code=True),  # ASP.NET
-    ".jsp": ExpectedFileProperties(is_code=True),  # Java Server Pages
-    ".map": ExpectedFileProperties(
-        is_code=True
-    ),  # Source Maps (JSON format, but relates to code)
-    ".webmanifest": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Web App Manifest (JSON format)
-    ".graphql": ExpectedFileProperties(is_code=True),  # GraphQL query language
-    ".gql": ExpectedFileProperties(is_code=True),  # GraphQL query language
+    ".html": _CODE,  # Markup is code-like
+    ".htm": _CODE,
+    ".css": _CODE,  # Stylesheets are code
+    ".scss": _CODE,  # SASS/SCSS
+    ".sass": _CODE,  # SASS (indented)
+    ".less": _CODE,  # LESS CSS preprocessor
+    ".styl": _CODE,  # Stylus CSS preprocessor
+    ".js": _CODE,  # JavaScript
+    ".jsx": _CODE,  # JavaScript React/JSX
+    ".mjs": _CODE,  # JavaScript ES Module
+    ".cjs": _CODE,  # JavaScript CommonJS Module
+    ".ts": _CODE,  # TypeScript
+    ".tsx": _CODE,  # TypeScript React/JSX
+    ".vue": _CODE,  # Vue.js Single File Components
+    ".svelte": _CODE,  # Svelte components
+    ".php": _CODE,  # PHP code
+    ".phtml": _CODE,  # PHP templated HTML
+    ".asp": _CODE,  # Classic ASP
+    ".aspx": _CODE,  # ASP.NET
+    ".jsp": _CODE,  # Java Server Pages
+    ".map": _CODE,  # Source Maps (JSON format, but relates to code)
+    ".webmanifest": _CONFIGURATION,  # Web App Manifest (JSON format)
+    ".graphql": _CODE,  # GraphQL query language
+    ".gql": _CODE,  # GraphQL query language
     # -- Programming Languages (Source Code) --
-    ".py": ExpectedFileProperties(is_code=True),  # Python
-    ".rb": ExpectedFileProperties(is_code=True),  # Ruby
-    ".java": ExpectedFileProperties(is_code=True),  # Java
-    ".kt": ExpectedFileProperties(is_code=True),  # Kotlin
-    ".kts": ExpectedFileProperties(is_code=True),  # Kotlin Script
-    ".scala": ExpectedFileProperties(is_code=True),  # Scala
-    ".swift": ExpectedFileProperties(is_code=True),  # Swift
-    ".c": ExpectedFileProperties(is_code=True),  # C
-    ".h": ExpectedFileProperties(is_code=True),  # C/C++/Objective-C Header
-    ".cpp": ExpectedFileProperties(is_code=True),  # C++
-    ".hpp": ExpectedFileProperties(is_code=True),  # C++ Header
-    ".cc": ExpectedFileProperties(is_code=True),  # C++
-    ".hh": ExpectedFileProperties(is_code=True),  # C++ Header
-    ".cxx": ExpectedFileProperties(is_code=True),  # C++
-    ".hxx": ExpectedFileProperties(is_code=True),  # C++ Header
-    ".m": ExpectedFileProperties(is_code=True),  # Objective-C
-    ".mm": ExpectedFileProperties(is_code=True),  # Objective-C++
-    ".cs": ExpectedFileProperties(is_code=True),  # C#
-    ".vb": ExpectedFileProperties(is_code=True),  # Visual Basic .NET
-    ".fs": ExpectedFileProperties(is_code=True),  # F#
-    ".fsi": ExpectedFileProperties(is_code=True),  # F# Signature
-    ".fsx": ExpectedFileProperties(is_code=True),  # F# Script
-    ".go": ExpectedFileProperties(is_code=True),  # Go
-    ".rs": ExpectedFileProperties(is_code=True),  # Rust
-    ".rlib": ExpectedFileProperties(
-        is_binary=True
-    ),  # Rust Library (metadata + native code)
-    ".hs": ExpectedFileProperties(is_code=True),  # Haskell
-    ".lhs": ExpectedFileProperties(is_code=True),  # Literate Haskell
-    ".erl": ExpectedFileProperties(is_code=True),  # Erlang
-    ".hrl": ExpectedFileProperties(is_code=True),  # Erlang Header
-    ".ex": ExpectedFileProperties(is_code=True),  # Elixir
-    ".exs": ExpectedFileProperties(is_code=True),  # Elixir Script
-    ".clj": ExpectedFileProperties(is_code=True),  # Clojure
-    ".cljs": ExpectedFileProperties(is_code=True),  # ClojureScript
-    ".cljc": ExpectedFileProperties(is_code=True),  # Clojure/ClojureScript common
-    ".edn": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Extensible Data Notation (Clojure data format)
-    ".lisp": ExpectedFileProperties(is_code=True),  # Common Lisp
-    ".lsp": ExpectedFileProperties(is_code=True),  # Lisp variant
-    ".scm": ExpectedFileProperties(is_code=True),  # Scheme
-    ".ss": ExpectedFileProperties(is_code=True),  # Scheme
-    ".rkt": ExpectedFileProperties(is_code=True),  # Racket
-    ".el": ExpectedFileProperties(is_code=True),  # Emacs Lisp
-    ".vim": ExpectedFileProperties(is_code=True),  # Vim Script
-    ".lua": ExpectedFileProperties(is_code=True),  # Lua
-    ".pl": ExpectedFileProperties(is_code=True),  # Perl
-    ".pm": ExpectedFileProperties(is_code=True),  # Perl Module
-    ".t": ExpectedFileProperties(is_code=True),  # Perl Test file
-    ".dart": ExpectedFileProperties(is_code=True),  # Dart
-    ".groovy": ExpectedFileProperties(is_code=True),  # Groovy
-    ".gvy": ExpectedFileProperties(is_code=True),  # Groovy
-    ".gradle": ExpectedFileProperties(
-        is_code=True
-    ),  # Gradle build script (Groovy or Kotlin)
-    ".tf": ExpectedFileProperties(is_code=True),  # Terraform (HCL code)
-    ".sql": ExpectedFileProperties(is_code=True),  # SQL code (queries, DDL, DML)
-    ".ddl": ExpectedFileProperties(is_code=True),  # SQL Data Definition Language
-    ".dml": ExpectedFileProperties(is_code=True),  # SQL Data Manipulation Language
-    ".ps1": ExpectedFileProperties(is_code=True),  # PowerShell Script
-    ".psm1": ExpectedFileProperties(is_code=True),  # PowerShell Module
-    ".psd1": ExpectedFileProperties(
-        is_configuration=True
-    ),  # PowerShell Data File (Manifest)
-    ".sh": ExpectedFileProperties(
-        is_code=True
-    ),  # Shell script (Bash, Zsh, etc.) - NOTE: Executable status depends on permissions/shebang
-    ".bash": ExpectedFileProperties(is_code=True),
-    ".zsh": ExpectedFileProperties(is_code=True),
-    ".ksh": ExpectedFileProperties(is_code=True),
-    ".csh": ExpectedFileProperties(is_code=True),
-    ".fish": ExpectedFileProperties(is_code=True),
-    ".awk": ExpectedFileProperties(is_code=True),  # AWK script
-    ".applescript": ExpectedFileProperties(is_code=True),  # AppleScript
-    ".scpt": ExpectedFileProperties(is_binary=True),  # Compiled AppleScript
-    ".coffee": ExpectedFileProperties(is_code=True),  # CoffeeScript
-    ".litcoffee": ExpectedFileProperties(is_code=True),  # Literate CoffeeScript
-    ".purs": ExpectedFileProperties(is_code=True),  # PureScript
-    ".elm": ExpectedFileProperties(is_code=True),  # Elm
-    ". R": ExpectedFileProperties(
-        is_code=True
-    ),  # R script (case sensitive on some systems)
-    ".r": ExpectedFileProperties(is_code=True),  # R script
-    ".rmd": ExpectedFileProperties(is_code=True),  # R Markdown (mix of text and code)
-    ".jl": ExpectedFileProperties(is_code=True),  # Julia
-    ".nim": ExpectedFileProperties(is_code=True),  # Nim
-    ".cr": ExpectedFileProperties(is_code=True),  # Crystal
-    ".v": ExpectedFileProperties(is_code=True),  # Verilog / V / Coq
-    ".vh": ExpectedFileProperties(is_code=True),  # Verilog Header
-    ".sv": ExpectedFileProperties(is_code=True),  # SystemVerilog
-    ".svh": ExpectedFileProperties(is_code=True),  # SystemVerilog Header
-    ".vhd": ExpectedFileProperties(is_code=True),  # VHDL
-    ".vhdl": ExpectedFileProperties(is_code=True),  # VHDL
-    ".zig": ExpectedFileProperties(is_code=True),  # Zig
-    ".odin": ExpectedFileProperties(is_code=True),  # Odin
-    ".d": ExpectedFileProperties(is_code=True),  # D language
-    ".f": ExpectedFileProperties(is_code=True),  # Fortran (fixed-form)
-    ".f90": ExpectedFileProperties(is_code=True),  # Fortran (free-form)
-    ".f95": ExpectedFileProperties(is_code=True),  # Fortran
-    ".f03": ExpectedFileProperties(is_code=True),  # Fortran
-    ".f08": ExpectedFileProperties(is_code=True),  # Fortran
-    ".for": ExpectedFileProperties(is_code=True),  # Fortran (fixed-form)
-    ".ada": ExpectedFileProperties(is_code=True),  # Ada
-    ".adb": ExpectedFileProperties(is_code=True),  # Ada Body
-    ".ads": ExpectedFileProperties(is_code=True),  # Ada Specification
-    ".cob": ExpectedFileProperties(is_code=True),  # COBOL
-    ".cbl": ExpectedFileProperties(is_code=True),  # COBOL
-    ".pas": ExpectedFileProperties(is_code=True),  # Pascal
-    ".pp": ExpectedFileProperties(is_code=True),  # Pascal / Puppet Manifest
-    ".inc": ExpectedFileProperties(
-        is_code=True
-    ),  # Include file (Pascal, PHP, Assembly etc.)
-    ".asm": ExpectedFileProperties(is_code=True),  # Assembly language
-    ".S": ExpectedFileProperties(
-        is_code=True
-    ),  # Assembly language (often needs preprocessing)
-    ".proto": ExpectedFileProperties(is_code=True),  # Protocol Buffers definition
-    ".thrift": ExpectedFileProperties(is_code=True),  # Apache Thrift definition
-    ".capnp": ExpectedFileProperties(is_code=True),  # Cap'n Proto definition
-    ".idl": ExpectedFileProperties(
-        is_code=True
-    ),  # Interface Definition Language (various)
-    ".mustache": ExpectedFileProperties(is_code=True),  # Mustache templates
-    ".hbs": ExpectedFileProperties(is_code=True),  # Handlebars templates
-    ".pug": ExpectedFileProperties(is_code=True),  # Pug templates (formerly Jade)
-    ".haml": ExpectedFileProperties(is_code=True),  # Haml templates
-    ".slim": ExpectedFileProperties(is_code=True),  # Slim templates
-    ".erb": ExpectedFileProperties(is_code=True),  # Embedded Ruby templates
-    ".j2": ExpectedFileProperties(is_code=True),  # Jinja2 templates
-    ".jinja2": ExpectedFileProperties(is_code=True),  # Jinja2 templates
-    ".twig": ExpectedFileProperties(is_code=True),  # Twig templates
+    ".py": _CODE,  # Python
+    ".rb": _CODE,  # Ruby
+    ".java": _CODE,  # Java
+    ".kt": _CODE,  # Kotlin
+    ".kts": _CODE,  # Kotlin Script
+    ".scala": _CODE,  # Scala
+    ".swift": _CODE,  # Swift
+    ".c": _CODE,  # C
+    ".h": _CODE,  # C/C++/Objective-C Header
+    ".cpp": _CODE,  # C++
+    ".hpp": _CODE,  # C++ Header
+    ".cc": _CODE,  # C++
+    ".hh": _CODE,  # C++ Header
+    ".cxx": _CODE,  # C++
+    ".hxx": _CODE,  # C++ Header
+    ".m": _CODE,  # Objective-C
+    ".mm": _CODE,  # Objective-C++
+    ".cs": _CODE,  # C#
+    ".vb": _CODE,  # Visual Basic .NET
+    ".fs": _CODE,  # F#
+    ".fsi": _CODE,  # F# Signature
+    ".fsx": _CODE,  # F# Script
+    ".go": _CODE,  # Go
+    ".rs": _CODE,  # Rust
+    ".rlib": _BINARY,  # Rust Library (metadata + native code)
+    ".hs": _CODE,  # Haskell
+    ".lhs": _CODE,  # Literate Haskell
+    ".erl": _CODE,  # Erlang
+    ".hrl": _CODE,  # Erlang Header
+    ".ex": _CODE,  # Elixir
+    ".exs": _CODE,  # Elixir Script
+    ".clj": _CODE,  # Clojure
+    ".cljs": _CODE,  # ClojureScript
+    ".cljc": _CODE,  # Clojure/ClojureScript common
+    ".edn": _CONFIGURATION,  # Extensible Data Notation (Clojure data format)
+    ".lisp": _CODE,  # Common Lisp
+    ".lsp": _CODE,  # Lisp variant
+    ".scm": _CODE,  # Scheme
+    ".ss": _CODE,  # Scheme
+    ".rkt": _CODE,  # Racket
+    ".el": _CODE,  # Emacs Lisp
+    ".vim": _CODE,  # Vim Script
+    ".lua": _CODE,  # Lua
+    ".pl": _CODE,  # Perl
+    ".pm": _CODE,  # Perl Module
+    ".t": _CODE,  # Perl Test file
+    ".dart": _CODE,  # Dart
+    ".groovy": _CODE,  # Groovy
+    ".gvy": _CODE,  # Groovy
+    ".gradle": _CODE,  # Gradle build script (Groovy or Kotlin)
+    ".tf": _CODE,  # Terraform (HCL code)
+    ".sql": _CODE,  # SQL code (queries, DDL, DML)
+    ".ddl": _CODE,  # SQL Data Definition Language
+    ".dml": _CODE,  # SQL Data Manipulation Language
+    ".ps1": _CODE,  # PowerShell Script
+    ".psm1": _CODE,  # PowerShell Module
+    ".psd1": _CONFIGURATION,  # PowerShell Data File (Manifest)
+    ".sh": _CODE,  # Shell script (Bash, Zsh, etc.) - NOTE: Executable status depends on permissions/shebang
+    ".bash": _CODE,
+    ".zsh": _CODE,
+    ".ksh": _CODE,
+    ".csh": _CODE,
+    ".fish": _CODE,
+    ".awk": _CODE,  # AWK script
+    ".applescript": _CODE,  # AppleScript
+    ".scpt": _BINARY,  # Compiled AppleScript
+    ".coffee": _CODE,  # CoffeeScript
+    ".litcoffee": _CODE,  # Literate CoffeeScript
+    ".purs": _CODE,  # PureScript
+    ".elm": _CODE,  # Elm
+    ".r": _CODE,  # R script (.R is the usual spelling)
+    ".rmd": _CODE,  # R Markdown (mix of text and code)
+    ".jl": _CODE,  # Julia
+    ".nim": _CODE,  # Nim
+    ".cr": _CODE,  # Crystal
+    ".v": _CODE,  # Verilog / V / Coq
+    ".vh": _CODE,  # Verilog Header
+    ".sv": _CODE,  # SystemVerilog
+    ".svh": _CODE,  # SystemVerilog Header
+    ".vhd": _CODE,  # VHDL
+    ".vhdl": _CODE,  # VHDL
+    ".zig": _CODE,  # Zig
+    ".odin": _CODE,  # Odin
+    ".d": _CODE,  # D language
+    ".f": _CODE,  # Fortran (fixed-form)
+    ".f90": _CODE,  # Fortran (free-form)
+    ".f95": _CODE,  # Fortran
+    ".f03": _CODE,  # Fortran
+    ".f08": _CODE,  # Fortran
+    ".for": _CODE,  # Fortran (fixed-form)
+    ".ada": _CODE,  # Ada
+    ".adb": _CODE,  # Ada Body
+    ".ads": _CODE,  # Ada Specification
+    ".cob": _CODE,  # COBOL
+    ".cbl": _CODE,  # COBOL
+    ".pas": _CODE,  # Pascal
+    ".pp": _CODE,  # Pascal / Puppet Manifest
+    ".inc": _CODE,  # Include file (Pascal, PHP, Assembly etc.)
+    ".asm": _CODE,  # Assembly language
+    ".s": _CODE,  # Assembly language (.S when it needs preprocessing)
+    ".proto": _CODE,  # Protocol Buffers definition
+    ".thrift": _CODE,  # Apache Thrift definition
+    ".capnp": _CODE,  # Cap'n Proto definition
+    ".idl": _CODE,  # Interface Definition Language (various)
+    ".mustache": _CODE,  # Mustache templates
+    ".hbs": _CODE,  # Handlebars templates
+    ".pug": _CODE,  # Pug templates (formerly Jade)
+    ".haml": _CODE,  # Haml templates
+    ".slim": _CODE,  # Slim templates
+    ".erb": _CODE,  # Embedded Ruby templates
+    ".j2": _CODE,  # Jinja2 templates
+    ".jinja2": _CODE,  # Jinja2 templates
+    ".twig": _CODE,  # Twig templates
     # -- Build System Specific --
-    ".pom": ExpectedFileProperties(is_configuration=True),  # Maven POM (XML)
-    ".csproj": ExpectedFileProperties(is_configuration=True),  # C# Project (XML)
-    ".vbproj": ExpectedFileProperties(is_configuration=True),  # VB.NET Project (XML)
-    ".fsproj": ExpectedFileProperties(is_configuration=True),  # F# Project (XML)
-    ".vcxproj": ExpectedFileProperties(
-        is_configuration=True
-    ),  # C++ Project (Visual Studio, XML)
-    ".sln": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Visual Studio Solution (custom text format)
-    ".xproj": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Old .NET Core Project (JSON)
-    ".build": ExpectedFileProperties(is_configuration=True),  # MSBuild file (XML)
-    ".sbt": ExpectedFileProperties(
-        is_code=True
-    ),  # Scala Build Tool definition (Scala code)
-    ".cmake": ExpectedFileProperties(is_code=True),  # CMake script
-    "CMakeLists.txt": ExpectedFileProperties(
-        is_code=True
-    ),  # CMake script (handle by name too)
+    ".pom": _CONFIGURATION,  # Maven POM (XML)
+    ".csproj": _CONFIGURATION,  # C# Project (XML)
+    ".vbproj": _CONFIGURATION,  # VB.NET Project (XML)
+    ".fsproj": _CONFIGURATION,  # F# Project (XML)
+    ".vcxproj": _CONFIGURATION,  # C++ Project (Visual Studio, XML)
+    ".sln": _PLAIN_TEXT,  # Visual Studio Solution (custom text format)
+    ".xproj": _CONFIGURATION,  # Old .NET Core Project (JSON)
+    ".build": _CONFIGURATION,  # MSBuild file (XML)
+    ".sbt": _CODE,  # Scala Build Tool definition (Scala code)
+    ".cmake": _CODE,  # CMake script
     # -- Binary / Compiled / Data Formats --
-    ".pyc": ExpectedFileProperties(is_binary=True),  # Python compiled bytecode
-    ".pyo": ExpectedFileProperties(is_binary=True),  # Python optimized bytecode
-    ".pyd": ExpectedFileProperties(
-        is_binary=True
-    ),  # Python extension module (Windows DLL)
-    ".so": ExpectedFileProperties(is_binary=True),  # Shared Object library (Linux/Unix)
-    ".dylib": ExpectedFileProperties(is_binary=True),  # Dynamic Library (macOS)
-    ".dll": ExpectedFileProperties(is_binary=True),  # Dynamic Link Library (Windows)
-    ".a": ExpectedFileProperties(is_binary=True),  # Static Library archive (Unix)
-    ".lib": ExpectedFileProperties(
-        is_binary=True
-    ),  # Static Library or Import Library (Windows)
-    ".o": ExpectedFileProperties(is_binary=True),  # Compiled object file (Unix)
-    ".obj": ExpectedFileProperties(is_binary=True),  # Compiled object file (Windows)
-    ".class": ExpectedFileProperties(is_binary=True),  # Java compiled bytecode
-    ".jar": ExpectedFileProperties(is_binary=True),  # Java Archive (ZIP format)
-    ".war": ExpectedFileProperties(
-        is_binary=True
-    ),  # Web Application Archive (ZIP format)
-    ".ear": ExpectedFileProperties(
-        is_binary=True
-    ),  # Enterprise Application Archive (ZIP format)
-    ".aar": ExpectedFileProperties(is_binary=True),  # Android Archive (ZIP format)
-    ".exe": ExpectedFileProperties(
-        is_binary=True, is_executable=True
-    ),  # Windows Executable
-    ".com": ExpectedFileProperties(
-        is_binary=True, is_executable=True
-    ),  # MS-DOS Executable (less common now)
-    ".bat": ExpectedFileProperties(
-        is_code=True, is_executable=True, is_crlf_native=True
-    ),  # Windows Batch script (text, but primarily executable)
-    ".cmd": ExpectedFileProperties(
-        is_code=True, is_executable=True, is_crlf_native=True
-    ),  # Windows Command script (text, but primarily executable)
-    ".msi": ExpectedFileProperties(is_binary=True),  # Microsoft Installer package
-    ".deb": ExpectedFileProperties(is_binary=True),  # Debian package (ar archive)
-    ".rpm": ExpectedFileProperties(is_binary=True),  # RPM package
-    ".pkg": ExpectedFileProperties(is_binary=True),  # macOS Installer package
-    ".dmg": ExpectedFileProperties(is_binary=True),  # macOS Disk Image
-    ".iso": ExpectedFileProperties(is_binary=True),  # ISO Disk Image
-    ".img": ExpectedFileProperties(is_binary=True),  # Disk Image
-    ".vmdk": ExpectedFileProperties(is_binary=True),  # Virtual Machine Disk (VMware)
-    ".vdi": ExpectedFileProperties(is_binary=True),  # Virtual Disk Image (VirtualBox)
-    ".ova": ExpectedFileProperties(
-        is_binary=True
-    ),  # Open Virtualization Archive (TAR format)
-    ".ovf": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Open Virtualization Format (XML)
-    ".apk": ExpectedFileProperties(is_binary=True),  # Android Package (ZIP format)
-    ".ipa": ExpectedFileProperties(
-        is_binary=True
-    ),  # iOS App Store Package (ZIP format)
-    ".app": ExpectedFileProperties(
-        is_binary=True
-    ),  # macOS Application Bundle (directory, but often treated as a single unit)
-    ".bin": ExpectedFileProperties(is_binary=True),  # Generic binary data
-    ".dat": ExpectedFileProperties(is_binary=True),  # Generic data file (often binary)
-    ".db": ExpectedFileProperties(is_binary=True),  # Generic database file
-    ".sqlite": ExpectedFileProperties(is_binary=True),  # SQLite Database
-    ".sqlite3": ExpectedFileProperties(is_binary=True),  # SQLite Database
-    ".dbf": ExpectedFileProperties(is_binary=True),  # dBase database file
-    ".mdb": ExpectedFileProperties(
-        is_binary=True
-    ),  # Microsoft Access Database (legacy)
-    ".accdb": ExpectedFileProperties(is_binary=True),  # Microsoft Access Database
-    ".sqlitedb": ExpectedFileProperties(is_binary=True),  # SQLite Database
-    ".feather": ExpectedFileProperties(
-        is_binary=True
-    ),  # Feather data format (Apache Arrow)
-    ".parquet": ExpectedFileProperties(is_binary=True),  # Parquet data format
-    ".avro": ExpectedFileProperties(is_binary=True),  # Avro data format
-    ".orc": ExpectedFileProperties(is_binary=True),  # ORC data format
-    ".npy": ExpectedFileProperties(is_binary=True),  # NumPy array data (binary)
-    ".npz": ExpectedFileProperties(is_binary=True),  # NumPy zipped archive (binary)
-    ".pkl": ExpectedFileProperties(is_binary=True),  # Python Pickle file (often binary)
-    ".pickle": ExpectedFileProperties(is_binary=True),  # Python Pickle file
-    ".joblib": ExpectedFileProperties(is_binary=True),  # Joblib dump file (Python)
-    ".h5": ExpectedFileProperties(is_binary=True),  # HDF5 data file
-    ".hdf5": ExpectedFileProperties(is_binary=True),  # HDF5 data file
-    ".ipynb": ExpectedFileProperties(
-        is_code=True
-    ),  # Jupyter Notebook (JSON format, but treated as code/document)
-    ".RData": ExpectedFileProperties(is_binary=True),  # R data file
-    ".rda": ExpectedFileProperties(is_binary=True),  # R data file (compressed)
-    ".rds": ExpectedFileProperties(is_binary=True),  # R single object data file
-    ".syd": ExpectedFileProperties(is_binary=True),  # SPSS System Data File
-    ".sav": ExpectedFileProperties(is_binary=True),  # SPSS Saved Data File
-    ".dta": ExpectedFileProperties(is_binary=True),  # Stata Data File
-    ".sas7bdat": ExpectedFileProperties(is_binary=True),  # SAS Data Set
-    ".mo": ExpectedFileProperties(
-        is_binary=True
-    ),  # Gettext Machine Object (compiled localization)
+    ".pyc": _BINARY,  # Python compiled bytecode
+    ".pyo": _BINARY,  # Python optimized bytecode
+    ".pyd": _BINARY,  # Python extension module (Windows DLL)
+    ".so": _BINARY,  # Shared Object library (Linux/Unix)
+    ".dylib": _BINARY,  # Dynamic Library (macOS)
+    ".dll": _BINARY,  # Dynamic Link Library (Windows)
+    ".a": _BINARY,  # Static Library archive (Unix)
+    ".lib": _BINARY,  # Static Library or Import Library (Windows)
+    ".o": _BINARY,  # Compiled object file (Unix)
+    ".obj": _BINARY,  # Compiled object file (Windows)
+    ".class": _BINARY,  # Java compiled bytecode
+    ".jar": _BINARY,  # Java Archive (ZIP format)
+    ".war": _BINARY,  # Web Application Archive (ZIP format)
+    ".ear": _BINARY,  # Enterprise Application Archive (ZIP format)
+    ".aar": _BINARY,  # Android Archive (ZIP format)
+    ".exe": _EXECUTABLE_BINARY,  # Windows Executable
+    ".com": _EXECUTABLE_BINARY,  # MS-DOS Executable (less common now)
+    ".bat": _WINDOWS_SCRIPT,  # Windows Batch script (text, but primarily executable)
+    ".cmd": _WINDOWS_SCRIPT,  # Windows Command script (text, but primarily executable)
+    ".msi": _BINARY,  # Microsoft Installer package
+    ".deb": _BINARY,  # Debian package (ar archive)
+    ".rpm": _BINARY,  # RPM package
+    ".pkg": _BINARY,  # macOS Installer package
+    ".dmg": _BINARY,  # macOS Disk Image
+    ".iso": _BINARY,  # ISO Disk Image
+    ".img": _BINARY,  # Disk Image
+    ".vmdk": _BINARY,  # Virtual Machine Disk (VMware)
+    ".vdi": _BINARY,  # Virtual Disk Image (VirtualBox)
+    ".ova": _BINARY,  # Open Virtualization Archive (TAR format)
+    ".ovf": _CONFIGURATION,  # Open Virtualization Format (XML)
+    ".apk": _BINARY,  # Android Package (ZIP format)
+    ".ipa": _BINARY,  # iOS App Store Package (ZIP format)
+    ".app": _BINARY,  # macOS Application Bundle (directory, but often treated as a single unit)
+    ".bin": _BINARY,  # Generic binary data
+    ".dat": _BINARY,  # Generic data file (often binary)
+    ".db": _BINARY,  # Generic database file
+    ".sqlite": _BINARY,  # SQLite Database
+    ".sqlite3": _BINARY,  # SQLite Database
+    ".dbf": _BINARY,  # dBase database file
+    ".mdb": _BINARY,  # Microsoft Access Database (legacy)
+    ".accdb": _BINARY,  # Microsoft Access Database
+    ".sqlitedb": _BINARY,  # SQLite Database
+    ".feather": _BINARY,  # Feather data format (Apache Arrow)
+    ".parquet": _BINARY,  # Parquet data format
+    ".avro": _BINARY,  # Avro data format
+    ".orc": _BINARY,  # ORC data format
+    ".npy": _BINARY,  # NumPy array data (binary)
+    ".npz": _BINARY,  # NumPy zipped archive (binary)
+    ".pkl": _BINARY,  # Python Pickle file (often binary)
+    ".pickle": _BINARY,  # Python Pickle file
+    ".joblib": _BINARY,  # Joblib dump file (Python)
+    ".h5": _BINARY,  # HDF5 data file
+    ".hdf5": _BINARY,  # HDF5 data file
+    ".ipynb": _CODE,  # Jupyter Notebook (JSON format, but treated as code/document)
+    ".rdata": _BINARY,  # R data file
+    ".rda": _BINARY,  # R data file (compressed)
+    ".rds": _BINARY,  # R single object data file
+    ".syd": _BINARY,  # SPSS System Data File
+    ".sav": _BINARY,  # SPSS Saved Data File
+    ".dta": _BINARY,  # Stata Data File
+    ".sas7bdat": _BINARY,  # SAS Data Set
+    ".mo": _BINARY,  # Gettext Machine Object (compiled localization)
     # -- Document Formats (Often Binary) --
-    ".pdf": ExpectedFileProperties(is_binary=True),
-    ".doc": ExpectedFileProperties(is_binary=True),  # MS Word (legacy)
-    ".docx": ExpectedFileProperties(is_binary=True),  # MS Word (OOXML)
-    ".rtf": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Rich Text Format (text, but complex) -> Changed to plain_text based on common understanding, though technically markup.
-    ".odt": ExpectedFileProperties(is_binary=True),  # OpenDocument Text (ZIP format)
-    ".wpd": ExpectedFileProperties(is_binary=True),  # WordPerfect Document
-    ".xls": ExpectedFileProperties(is_binary=True),  # MS Excel (legacy)
-    ".xlsx": ExpectedFileProperties(is_binary=True),  # MS Excel (OOXML)
-    ".ods": ExpectedFileProperties(
-        is_binary=True
-    ),  # OpenDocument Spreadsheet (ZIP format)
-    ".ppt": ExpectedFileProperties(is_binary=True),  # MS PowerPoint (legacy)
-    ".pptx": ExpectedFileProperties(is_binary=True),  # MS PowerPoint (OOXML)
-    ".odp": ExpectedFileProperties(
-        is_binary=True
-    ),  # OpenDocument Presentation (ZIP format)
-    ".key": ExpectedFileProperties(
-        is_binary=True
-    ),  # Apple Keynote Presentation (ZIP format)
-    ".numbers": ExpectedFileProperties(
-        is_binary=True
-    ),  # Apple Numbers Spreadsheet (ZIP format)
-    ".pages": ExpectedFileProperties(
-        is_binary=True
-    ),  # Apple Pages Document (ZIP format)
+    ".pdf": _BINARY,
+    ".doc": _BINARY,  # MS Word (legacy)
+    ".docx": _BINARY,  # MS Word (OOXML)
+    ".rtf": _PLAIN_TEXT,  # Rich Text Format (text, but complex) -> Changed to plain_text based on common understanding, though technically markup.
+    ".odt": _BINARY,  # OpenDocument Text (ZIP format)
+    ".wpd": _BINARY,  # WordPerfect Document
+    ".xls": _BINARY,  # MS Excel (legacy)
+    ".xlsx": _BINARY,  # MS Excel (OOXML)
+    ".ods": _BINARY,  # OpenDocument Spreadsheet (ZIP format)
+    ".ppt": _BINARY,  # MS PowerPoint (legacy)
+    ".pptx": _BINARY,  # MS PowerPoint (OOXML)
+    ".odp": _BINARY,  # OpenDocument Presentation (ZIP format)
+    ".numbers": _BINARY,  # Apple Numbers Spreadsheet (ZIP format)
+    ".pages": _BINARY,  # Apple Pages Document (ZIP format)
     # -- Image Formats (Binary) --
-    ".jpg": ExpectedFileProperties(is_binary=True),
-    ".jpeg": ExpectedFileProperties(is_binary=True),
-    ".png": ExpectedFileProperties(is_binary=True),
-    ".gif": ExpectedFileProperties(is_binary=True),
-    ".bmp": ExpectedFileProperties(is_binary=True),
-    ".tiff": ExpectedFileProperties(is_binary=True),
-    ".tif": ExpectedFileProperties(is_binary=True),
-    ".webp": ExpectedFileProperties(is_binary=True),
-    ".ico": ExpectedFileProperties(is_binary=True),  # Icon file
-    ".icns": ExpectedFileProperties(is_binary=True),  # Apple Icon Image format
-    ".psd": ExpectedFileProperties(is_binary=True),  # Photoshop Document
-    ".ai": ExpectedFileProperties(
-        is_binary=True
-    ),  # Adobe Illustrator (often PDF-based)
-    ".eps": ExpectedFileProperties(is_binary=True),  # Encapsulated PostScript
-    ".svg": ExpectedFileProperties(
-        is_code=True
-    ),  # Scalable Vector Graphics (XML based, so text/code)
-    ".dxf": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Drawing Exchange Format (CAD, often text)
-    ".dwg": ExpectedFileProperties(is_binary=True),  # AutoCAD Drawing (binary)
-    ".xcf": ExpectedFileProperties(is_binary=True),  # GIMP image format
+    ".jpg": _BINARY,
+    ".jpeg": _BINARY,
+    ".png": _BINARY,
+    ".gif": _BINARY,
+    ".bmp": _BINARY,
+    ".tiff": _BINARY,
+    ".tif": _BINARY,
+    ".webp": _BINARY,
+    ".ico": _BINARY,  # Icon file
+    ".icns": _BINARY,  # Apple Icon Image format
+    ".psd": _BINARY,  # Photoshop Document
+    ".ai": _BINARY,  # Adobe Illustrator (often PDF-based)
+    ".eps": _BINARY,  # Encapsulated PostScript
+    ".svg": _CODE,  # Scalable Vector Graphics (XML based, so text/code)
+    ".dxf": _PLAIN_TEXT,  # Drawing Exchange Format (CAD, often text)
+    ".dwg": _BINARY,  # AutoCAD Drawing (binary)
+    ".xcf": _BINARY,  # GIMP image format
     # -- Audio Formats (Binary) --
-    ".mp3": ExpectedFileProperties(is_binary=True),
-    ".wav": ExpectedFileProperties(is_binary=True),
-    ".ogg": ExpectedFileProperties(is_binary=True),  # Ogg Vorbis audio
-    ".flac": ExpectedFileProperties(is_binary=True),  # Free Lossless Audio Codec
-    ".aac": ExpectedFileProperties(is_binary=True),  # Advanced Audio Coding
-    ".m4a": ExpectedFileProperties(is_binary=True),  # Apple Lossless Audio / AAC audio
-    ".wma": ExpectedFileProperties(is_binary=True),  # Windows Media Audio
-    ".aiff": ExpectedFileProperties(is_binary=True),  # Audio Interchange File Format
-    ".opus": ExpectedFileProperties(is_binary=True),  # Opus audio codec
+    ".mp3": _BINARY,
+    ".wav": _BINARY,
+    ".ogg": _BINARY,  # Ogg Vorbis audio
+    ".flac": _BINARY,  # Free Lossless Audio Codec
+    ".aac": _BINARY,  # Advanced Audio Coding
+    ".m4a": _BINARY,  # Apple Lossless Audio / AAC audio
+    ".wma": _BINARY,  # Windows Media Audio
+    ".aiff": _BINARY,  # Audio Interchange File Format
+    ".opus": _BINARY,  # Opus audio codec
     # -- Video Formats (Binary) --
-    ".mp4": ExpectedFileProperties(is_binary=True),
-    ".mkv": ExpectedFileProperties(is_binary=True),  # Matroska Video
-    ".mov": ExpectedFileProperties(is_binary=True),  # QuickTime Movie
-    ".avi": ExpectedFileProperties(is_binary=True),  # Audio Video Interleave
-    ".wmv": ExpectedFileProperties(is_binary=True),  # Windows Media Video
-    ".flv": ExpectedFileProperties(is_binary=True),  # Flash Video
-    ".webm": ExpectedFileProperties(
-        is_binary=True
-    ),  # WebM Video (VP8/VP9/AV1 + Vorbis/Opus)
-    ".mpeg": ExpectedFileProperties(is_binary=True),
-    ".mpg": ExpectedFileProperties(is_binary=True),
-    ".ogv": ExpectedFileProperties(is_binary=True),  # Ogg Video
-    ".3gp": ExpectedFileProperties(is_binary=True),  # 3GPP multimedia format
-    ".m4v": ExpectedFileProperties(
-        is_binary=True
-    ),  # M4V video format (often for Apple devices)
+    ".mp4": _BINARY,
+    ".mkv": _BINARY,  # Matroska Video
+    ".mov": _BINARY,  # QuickTime Movie
+    ".avi": _BINARY,  # Audio Video Interleave
+    ".wmv": _BINARY,  # Windows Media Video
+    ".flv": _BINARY,  # Flash Video
+    ".webm": _BINARY,  # WebM Video (VP8/VP9/AV1 + Vorbis/Opus)
+    ".mpeg": _BINARY,
+    ".mpg": _BINARY,
+    ".ogv": _BINARY,  # Ogg Video
+    ".3gp": _BINARY,  # 3GPP multimedia format
+    ".m4v": _BINARY,  # M4V video format (often for Apple devices)
     # -- Archive Formats (Binary) --
-    ".zip": ExpectedFileProperties(is_binary=True),
-    ".tar": ExpectedFileProperties(is_binary=True),  # Tarball (uncompressed archive)
-    ".gz": ExpectedFileProperties(is_binary=True),  # Gzip compressed file
-    ".tgz": ExpectedFileProperties(is_binary=True),  # Gzipped Tarball (.tar.gz)
-    ".bz2": ExpectedFileProperties(is_binary=True),  # Bzip2 compressed file
-    ".tbz": ExpectedFileProperties(is_binary=True),  # Bzipped Tarball (.tar.bz2)
-    ".tbz2": ExpectedFileProperties(is_binary=True),  # Bzipped Tarball (.tar.bz2)
-    ".xz": ExpectedFileProperties(is_binary=True),  # XZ compressed file
-    ".txz": ExpectedFileProperties(is_binary=True),  # XZ compressed Tarball (.tar.xz)
-    ".lzma": ExpectedFileProperties(is_binary=True),  # LZMA compressed file
-    ".tlz": ExpectedFileProperties(
-        is_binary=True
-    ),  # LZMA compressed Tarball (.tar.lzma)
-    ".7z": ExpectedFileProperties(is_binary=True),  # 7-Zip archive
-    ".rar": ExpectedFileProperties(is_binary=True),  # RAR archive
-    ".z": ExpectedFileProperties(is_binary=True),  # compress (Unix legacy)
-    ".zst": ExpectedFileProperties(is_binary=True),  # Zstandard compressed file
-    ".whl": ExpectedFileProperties(is_binary=True),  # Python Wheel package (ZIP format)
+    ".zip": _BINARY,
+    ".tar": _BINARY,  # Tarball (uncompressed archive)
+    ".gz": _BINARY,  # Gzip compressed file
+    ".tgz": _BINARY,  # Gzipped Tarball (.tar.gz)
+    ".bz2": _BINARY,  # Bzip2 compressed file
+    ".tbz": _BINARY,  # Bzipped Tarball (.tar.bz2)
+    ".tbz2": _BINARY,  # Bzipped Tarball (.tar.bz2)
+    ".xz": _BINARY,  # XZ compressed file
+    ".txz": _BINARY,  # XZ compressed Tarball (.tar.xz)
+    ".lzma": _BINARY,  # LZMA compressed file
+    ".tlz": _BINARY,  # LZMA compressed Tarball (.tar.lzma)
+    ".7z": _BINARY,  # 7-Zip archive
+    ".rar": _BINARY,  # RAR archive
+    ".z": _BINARY,  # compress (Unix legacy)
+    ".zst": _BINARY,  # Zstandard compressed file
+    ".whl": _BINARY,  # Python Wheel package (ZIP format)
     # -- Font Formats (Binary) --
-    ".ttf": ExpectedFileProperties(is_binary=True),  # TrueType Font
-    ".otf": ExpectedFileProperties(is_binary=True),  # OpenType Font
-    ".woff": ExpectedFileProperties(is_binary=True),  # Web Open Font Format
-    ".woff2": ExpectedFileProperties(is_binary=True),  # Web Open Font Format 2
-    ".eot": ExpectedFileProperties(is_binary=True),  # Embedded OpenType
+    ".ttf": _BINARY,  # TrueType Font
+    ".otf": _BINARY,  # OpenType Font
+    ".woff": _BINARY,  # Web Open Font Format
+    ".woff2": _BINARY,  # Web Open Font Format 2
+    ".eot": _BINARY,  # Embedded OpenType
     # -- Security Sensitive Files (Often certificates/keys) --
-    ".pem": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=True
-    ),  # Privacy-Enhanced Mail cert/key (Base64 text)
-    ".key": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=True
-    ),  # Private Key (often PEM format)
-    ".crt": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=False
-    ),  # Certificate (often PEM format, usually public)
-    ".cer": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=False
-    ),  # Certificate (alternative extension)
-    ".der": ExpectedFileProperties(
-        is_binary=True, is_security_sensitive=False
-    ),  # Distinguished Encoding Rules cert/key (binary)
-    ".p12": ExpectedFileProperties(
-        is_binary=True, is_security_sensitive=True
-    ),  # PKCS#12 key/cert bundle (binary)
-    ".pfx": ExpectedFileProperties(
-        is_binary=True, is_security_sensitive=True
-    ),  # Personal Information Exchange (like .p12)
-    ".p7b": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=False
-    ),  # PKCS#7 cert bundle (text)
-    ".p7c": ExpectedFileProperties(
-        is_binary=True, is_security_sensitive=False
-    ),  # PKCS#7 cert bundle (binary)
-    ".jks": ExpectedFileProperties(
-        is_binary=True, is_security_sensitive=True
-    ),  # Java KeyStore
-    ".pub": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=False
-    ),  # Public key file (e.g., SSH)
-    ".asc": ExpectedFileProperties(
-        is_plain_text=True, is_security_sensitive=False
-    ),  # PGP armored file (key, signature, or encrypted data)
-    ".gpg": ExpectedFileProperties(
-        is_binary=True, is_security_sensitive=True
-    ),  # PGP encrypted file (binary)
-    ".kdbx": ExpectedFileProperties(
-        is_binary=True, is_security_sensitive=True
-    ),  # KeePass password database
+    ".pem": _SENSITIVE_PLAIN_TEXT,  # Privacy-Enhanced Mail cert/key (Base64 text)
+    ".key": _SENSITIVE_PLAIN_TEXT,  # Private Key (often PEM format) or Apple Keynote
+    ".crt": _PLAIN_TEXT,  # Certificate (often PEM format, usually public)
+    ".cer": _PLAIN_TEXT,  # Certificate (alternative extension)
+    ".der": _BINARY,  # Distinguished Encoding Rules cert/key (binary)
+    ".p12": _SENSITIVE_BINARY,  # PKCS#12 key/cert bundle (binary)
+    ".pfx": _SENSITIVE_BINARY,  # Personal Information Exchange (like .p12)
+    ".p7b": _PLAIN_TEXT,  # PKCS#7 cert bundle (text)
+    ".p7c": _BINARY,  # PKCS#7 cert bundle (binary)
+    ".jks": _SENSITIVE_BINARY,  # Java KeyStore
+    ".pub": _PLAIN_TEXT,  # Public key file (e.g., SSH)
+    ".asc": _PLAIN_TEXT,  # PGP armored file (key, signature, or encrypted data)
+    ".gpg": _SENSITIVE_BINARY,  # PGP encrypted file (binary)
+    ".kdbx": _SENSITIVE_BINARY,  # KeePass password database
     # -- Misc --
-    ".bak": ExpectedFileProperties(
-        is_binary=True
-    ),  # Backup file (could be text or binary) -> Defaulting to binary as a safe guess
-    ".tmp": ExpectedFileProperties(
-        is_binary=True
-    ),  # Temporary file (could be anything) -> Defaulting to binary
-    ".swp": ExpectedFileProperties(is_binary=True),  # Vim swap file
-    ".swo": ExpectedFileProperties(is_binary=True),  # Vim swap file
-    ".lock": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Lock file (often empty or simple text)
-    ".pid": ExpectedFileProperties(is_plain_text=True),  # Process ID file
-    ".service": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Systemd service unit file (INI-like)
-    ".socket": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Systemd socket unit file
-    ".timer": ExpectedFileProperties(is_configuration=True),  # Systemd timer unit file
-    ".target": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Systemd target unit file
-    ".mount": ExpectedFileProperties(is_configuration=True),  # Systemd mount unit file
-    ".automount": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Systemd automount unit file
-    ".path": ExpectedFileProperties(is_configuration=True),  # Systemd path unit file
-    ".scope": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Systemd scope unit file (runtime)
-    ".slice": ExpectedFileProperties(is_configuration=True),  # Systemd slice unit file
-    ".desktop": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Linux Desktop entry file (INI-like)
-    ".xsd": ExpectedFileProperties(
-        is_configuration=True
-    ),  # XML Schema Definition (XML)
-    ".xsl": ExpectedFileProperties(is_code=True),  # XSL Transformation (XML code)
-    ".xslt": ExpectedFileProperties(is_code=True),  # XSL Transformation (XML code)
-    ".dtd": ExpectedFileProperties(
-        is_configuration=True
-    ),  # Document Type Definition (SGML/XML schema)
-    ".mod": ExpectedFileProperties(
-        is_code=True
-    ),  # Module file (various langs like Go, Fortran)
-    ".sig": ExpectedFileProperties(
-        is_plain_text=True
-    ),  # Signature file (e.g., F#, or GPG .asc)
-    ".sym": ExpectedFileProperties(is_binary=True),  # Debug symbols (binary)
-    ".pdb": ExpectedFileProperties(
-        is_binary=True
-    ),  # Program Database (debug symbols, Windows binary)
-    ".DS_Store": ExpectedFileProperties(is_binary=True),  # macOS Finder metadata
-    "Thumbs.db": ExpectedFileProperties(
-        is_binary=True
-    ),  # Windows Explorer thumbnail cache
+    ".bak": _BINARY,  # Backup file (could be text or binary) -> Defaulting to binary as a safe guess
+    ".tmp": _BINARY,  # Temporary file (could be anything) -> Defaulting to binary
+    ".swp": _BINARY,  # Vim swap file
+    ".swo": _BINARY,  # Vim swap file
+    ".lock": _PLAIN_TEXT,  # Lock file (often empty or simple text)
+    ".pid": _PLAIN_TEXT,  # Process ID file
+    ".service": _CONFIGURATION,  # Systemd service unit file (INI-like)
+    ".socket": _CONFIGURATION,  # Systemd socket unit file
+    ".timer": _CONFIGURATION,  # Systemd timer unit file
+    ".target": _CONFIGURATION,  # Systemd target unit file
+    ".mount": _CONFIGURATION,  # Systemd mount unit file
+    ".automount": _CONFIGURATION,  # Systemd automount unit file
+    ".path": _CONFIGURATION,  # Systemd path unit file
+    ".scope": _CONFIGURATION,  # Systemd scope unit file (runtime)
+    ".slice": _CONFIGURATION,  # Systemd slice unit file
+    ".desktop": _CONFIGURATION,  # Linux Desktop entry file (INI-like)
+    ".xsd": _CONFIGURATION,  # XML Schema Definition (XML)
+    ".xsl": _CODE,  # XSL Transformation (XML code)
+    ".xslt": _CODE,  # XSL Transformation (XML code)
+    ".dtd": _CONFIGURATION,  # Document Type Definition (SGML/XML schema)
+    ".mod": _CODE,  # Module file (various langs like Go, Fortran)
+    ".sig": _PLAIN_TEXT,  # Signature file (e.g., F#, or GPG .asc)
+    ".sym": _BINARY,  # Debug symbols (binary)
+    ".pdb": _BINARY,  # Program Database (debug symbols, Windows binary)
 }
 
 
 # Function remains the same
 def get_expected_file_properties(filepath: Path) -> Optional[ExpectedFileProperties]:
-    name = filepath.name
-    ext = filepath.suffix.lower()  # Ensure extension is lower case for lookup
+    props = get_expected_file_properties_by_name(filepath.name)
+    # ``.key`` is both a private key and an Apple Keynote presentation (ZIP)
+    if os.path.splitext(filepath.name)[1].lower() == ".key" and _has_zip_header(
+        filepath
+    ):
+        return _BINARY
+    return props
 
-    # Prioritize lookup by full name (case sensitive based on dict keys)
-    if name in PROPERTIES_BY_NAME:
-        return PROPERTIES_BY_NAME[name]
 
-    # Fallback to lookup by extension (case insensitive due to .lower())
-    if ext in PROPERTIES_BY_EXTENSION:
-        return PROPERTIES_BY_EXTENSION[ext]
+def _has_zip_header(filepath: Path) -> bool:
+    try:
+        with open(filepath, "rb") as f:
+            return f.read(4) == b"PK\x03\x04"
+    except OSError:
+        return False
+
+
+# Repository walks see the same file names (``__init__.py``, ``README.md``, ...)
+# over and over, so classify by name once and reuse the answer.
+@lru_cache(maxsize=65536)
+def get_expected_file_properties_by_name(
+    name: str,
+) -> Optional[ExpectedFileProperties]:
+    # Prioritize lookup by full name (case sensitive based on dict keys)
+    props = PROPERTIES_BY_NAME.get(name)
+    if props is not None:
+        return props
 
-    # Return None if no match found
-    return None
+    # Fallback to lookup by extension (case insensitive due to .lower()).
+    # Returns None if no match found.
+    return PROPERTIES_BY_EXTENSION.get(os.path.splitext(name)[1].lower())
 
 
 # Example Usage (Optional)
@@ -1,5 +1,6 @@
 from typing import Any, List, Optional, Tuple
 import re
+from functools import lru_cache
 from dataclasses import dataclass
 from enum import Enum
 
@@ -20,6 +21,16 @@ MAVEN_COORDINATE_PATTERN = r"""
 MAVEN_COORDINATE_RE = re.compile(MAVEN_COORDINATE_PATTERN, re.VERBOSE)
 
 
+@lru_cache(maxsize=2048)
+def _split_maven_coordinate(coordinate: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Returns the (group id, artifact id, version) of a Maven coordinate, or None
+    if it is invalid. Cached, since configs refer to the same artifacts many times.
+    """
+    match = MAVEN_COORDINATE_RE.match(coordinate)
+    return match.groups() if match else None
+
+
 class VersionAxis(Enum):
     ALPHA = "alpha"
     BETA = "beta"
@@ -253,19 +264,26 @@ class MavenCoordinate:
         return f"{self.group_id}:{self.artifact_id}:{self.version}"
 
     @classmethod
-    def parse(cls, coordinate: str) -> "MavenCoordinate":
-        match = MAVEN_COORDINATE_RE.match(coordinate)
-        if not match:
-            raise ValueError(f"Invalid Maven coordinate: {coordinate}")
+    def parse_or_null(cls, coordinate: str) -> Optional["MavenCoordinate"]:
+        parts = _split_maven_coordinate(coordinate)
+        if parts is None:
+            return None
 
-        group_id, artifact_id, version_str = match.groups()
+        group_id, artifact_id, version_str = parts
         version = version_str  # Version.parse(version_str)
 
         return cls(group_id=group_id, artifact_id=artifact_id, version=version)
 
+    @classmethod
+    def parse(cls, coordinate: str) -> "MavenCoordinate":
+        result = cls.parse_or_null(coordinate)
+        if result is None:
+            raise ValueError(f"Invalid Maven coordinate: {coordinate}")
+        return result
+
 
 def is_valid_maven_coordinate(coordinate: str) -> bool:
-    return bool(MAVEN_COORDINATE_RE.match(coordinate))
+    return _split_maven_coordinate(coordinate) is not None
 
 
 @dataclass
@@ -0,0 +1,199 @@
+import asyncio
+import os
+import stat
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dev.download import _check_response, save_uri, save_uris, save_uris_async
+
+OLD_DATE = "Thu, 01 Jan 2015 00:00:00 GMT"
+OLD_TIME = 1420070400
+
+
+class FakeServer:
+    """
+    Serves ``files`` (path -> (body, headers)) over HTTP on localhost and
+    records the request headers it receives.
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.requests = []
+        # Servers that ignore conditional headers always answer 200
+        self.honor_conditionals = True
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                body, headers = server.files[self.path]
+                etag = headers.get("ETag")
+                if (
+                    server.honor_conditionals
+                    and etag is not None
+                    and self.headers.get("If-None-Match") == etag
+                ):
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def serve(self, path, body, **headers):
+        self.files[path] = (body, headers)
+        return self.url + path
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    fake = FakeServer()
+    thread = threading.Thread(target=fake.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield fake
+    fake.httpd.shutdown()
+    fake.httpd.server_close()
+
+
+def test_check_response_not_modified():
+    assert _check_response(304, {"ETag": '"A"'}, 2e9, '"A"')[0] is False
+
+
+def test_check_response_same_etag_skips_body():
+    assert _check_response(200, {"ETag": '"A"'}, 2e9, '"A"')[0] is False
+
+
+def test_check_response_changed_etag_wins_over_old_date():
+    needs_download, new_etag, last_modified = _check_response(
+        200, {"ETag": '"B"', "Last-Modified": OLD_DATE}, 2e9, '"A"'
+    )
+    assert needs_download is True
+    assert new_etag == '"B"'
+    assert last_modified == OLD_TIME
+
+
+def test_check_response_old_date_without_etag_skips_body():
+    assert _check_response(200, {"Last-Modified": OLD_DATE}, 2e9, '"A"')[0] is False
+
+
+def test_check_response_first_download():
+    assert _check_response(200, {"Last-Modified": OLD_DATE}, None, None)[0] is True
+
+
+def test_save_uri_writes_body_etag_and_mtime(server, tmp_path):
+    uri = server.serve("/f", b"hello", ETag='"A"', **{"Last-Modified": OLD_DATE})
+    path = str(tmp_path / "f")
+    save_uri(uri, path)
+
+    with open(path, "rb") as f:
+        assert f.read() == b"hello"
+    with open(path + ".etag") as f:
+        assert f.read() == '"A"'
+    assert os.stat(path).st_mtime == OLD_TIME
+    # New downloads get the usual mode, not mkstemp's 0600
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~umask
+    assert sorted(os.listdir(tmp_path)) == ["f", "f.etag"]
+
+
+def test_save_uri_sends_conditional_headers(server, tmp_path):
+    uri = server.serve("/f", b"hello", ETag='"A"', **{"Last-Modified": OLD_DATE})
+    path = str(tmp_path / "f")
+    save_uri(uri, path)
+    os.chmod(path, 0o640)
+    save_uri(uri, path)
+
+    _, headers = server.requests[-1]
+    assert headers["If-None-Match"] == '"A"'
+    assert headers["If-Modified-Since"] == formatdate(OLD_TIME, usegmt=True)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_save_uri_replaces_changed_body_and_keeps_mode(server, tmp_path):
+    path = str(tmp_path / "f")
+    save_uri(server.serve("/f", b"old", ETag='"A"'), path)
+    os.chmod(path, 0o640)
+    save_uri(server.serve("/f", b"new", ETag='"B"'), path)
+
+    with open(path, "rb") as f:
+        assert f.read() == b"new"
+    with open(path + ".etag") as f:
+        assert f.read() == '"B"'
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_save_uri_checks_validators_when_server_ignores_them(server, tmp_path):
+    server.honor_conditionals = False
+    path = str(tmp_path / "f")
+    save_uri(server.serve("/f", b"old", **{"Last-Modified": OLD_DATE}), path)
+    os.utime(path, (OLD_TIME + 10, OLD_TIME + 10))
+
+    # Same ETag-less resource, not newer than our copy: the body is ignored
+    save_uri(server.serve("/f", b"ignored", **{"Last-Modified": OLD_DATE}), path)
+    with open(path, "rb") as f:
+        assert f.read() == b"old"
+    assert not os.path.exists(path + ".etag")
+
+
+def test_save_uri_ignores_unchanged_body_with_same_etag(server, tmp_path):
+    server.honor_conditionals = False
+    path = str(tmp_path / "f")
+    save_uri(server.serve("/f", b"old", ETag='"A"'), path)
+    save_uri(server.serve("/f", b"ignored", ETag='"A"'), path)
+    with open(path, "rb") as f:
+        assert f.read() == b"old"
+
+
+def test_save_uri_downloads_changed_etag_with_old_date(server, tmp_path):
+    server.honor_conditionals = False
+    path = str(tmp_path / "f")
+    save_uri(server.serve("/f", b"old", ETag='"A"'), path)
+    save_uri(
+        server.serve("/f", b"new", ETag='"B"', **{"Last-Modified": OLD_DATE}), path
+    )
+    with open(path, "rb") as f:
+        assert f.read() == b"new"
+    with open(path + ".etag") as f:
+        assert f.read() == '"B"'
+
+
+def test_save_uris(server, tmp_path):
+    pairs = [
+        (server.serve(f"/f{i}", f"body {i}".encode()), str(tmp_path / f"f{i}"))
+        for i in range(5)
+    ]
+    save_uris(pairs, max_workers=3)
+    for i in range(5):
+        with open(tmp_path / f"f{i}", "rb") as f:
+            assert f.read() == f"body {i}".encode()
+
+
+def test_save_uris_async(server, tmp_path):
+    pairs = [
+        (
+            server.serve(f"/f{i}", f"body {i}".encode(), ETag=f'"{i}"'),
+            str(tmp_path / f"f{i}"),
+        )
+        for i in range(5)
+    ]
+    asyncio.run(save_uris_async(pairs, max_connections=2))
+    for i in range(5):
+        with open(tmp_path / f"f{i}", "rb") as f:
+            assert f.read() == f"body {i}".encode()
+        with open(tmp_path / f"f{i}.etag") as f:
+            assert f.read() == f'"{i}"'
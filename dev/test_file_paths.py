@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+
+from dev.checks.file_paths import E_SENSITIVE_FILENAME, SensitiveFilenameCheck
+
+
+def matched_patterns(name, check=SensitiveFilenameCheck()):
+    issues = check.check(Path(name), None)
+    assert all(issue.issue_type == E_SENSITIVE_FILENAME for issue in issues)
+    return [issue.data["pattern"] for issue in issues]
+
+
+@pytest.mark.parametrize(
+    "name, pattern",
+    [
+        ("notes.bak", ".bak"),
+        ("prod.env", ".env"),
+        ("Config.BAK", ".bak"),
+    ],
+)
+def test_extension_patterns_match_as_suffix(name, pattern):
+    assert pattern in matched_patterns(name)
+
+
+def test_exact_name_is_reported_once():
+    assert matched_patterns(".env") == [".env"]
+
+
+def test_delimited_patterns_match():
+    assert "private_key" in matched_patterns("my_private_key.pem")
+
+
+@pytest.mark.parametrize("name", ["playback.txt", "environment.py", "README.md"])
+def test_undelimited_substrings_do_not_match(name):
+    assert matched_patterns(name) == []
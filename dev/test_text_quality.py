@@ -0,0 +1,114 @@
+import os
+import stat
+
+import pytest
+
+import dev.checks.text_quality as text_quality
+from dev.checks.text_quality import (
+    E_LINE_ENDINGS,
+    E_NO_NEWLINE,
+    LineEnding,
+    TextQualityCheck,
+    fix_text_file,
+    get_line_ending_counts,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    """Keeps the checks from writing .dev.cache.db into the working directory."""
+    monkeypatch.setenv("DEV_NO_CACHE", "1")
+
+
+def issue_types(path):
+    return [issue.issue_type for issue in TextQualityCheck().check(path)]
+
+
+def test_line_ending_counts(tmp_path):
+    path = tmp_path / "mixed.txt"
+    path.write_bytes(b"a\r\nb\nc\rd\r\ne\n")
+    assert get_line_ending_counts(path) == {
+        LineEnding.CRLF: 2,
+        LineEnding.LF: 2,
+        LineEnding.CR: 1,
+    }
+
+
+def test_line_ending_counts_crlf_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(text_quality, "CHUNK_BYTE_SIZE", 2)
+    path = tmp_path / "split.txt"
+    # The first "\r\n" straddles the boundary between the first two chunks
+    path.write_bytes(b"a\r\nb\r\n\n")
+    assert get_line_ending_counts(path) == {
+        LineEnding.CRLF: 2,
+        LineEnding.LF: 1,
+        LineEnding.CR: 0,
+    }
+
+
+def test_lf_in_crlf_native_file_is_reported(tmp_path):
+    path = tmp_path / "build.bat"
+    path.write_bytes(b"@echo off\r\necho hi\n")
+    assert E_LINE_ENDINGS in issue_types(path)
+
+    path.write_bytes(b"@echo off\r\necho hi\r\n")
+    assert E_LINE_ENDINGS not in issue_types(path)
+
+
+def test_crlf_in_lf_file_is_reported(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"one\r\ntwo\n")
+    assert E_LINE_ENDINGS in issue_types(path)
+
+
+def test_fix_text_file_converts_line_endings(tmp_path):
+    path = tmp_path / "build.bat"
+    path.write_bytes(b"a\nb\rc\r\n")
+    fix_text_file(path, target_ending=LineEnding.CRLF)
+    assert path.read_bytes() == b"a\r\nb\r\nc\r\n"
+
+
+def test_fix_text_file_is_atomic(tmp_path):
+    path = tmp_path / "script.sh"
+    path.write_bytes(b"echo hi  \n")
+    os.chmod(path, 0o754)
+    fix_text_file(path, strip_trailing=True)
+    assert path.read_bytes() == b"echo hi\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o754
+    # The temporary file was renamed over the original
+    assert os.listdir(tmp_path) == ["script.sh"]
+
+
+def test_fix_text_file_keeps_original_on_error(tmp_path, monkeypatch):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"text  \n")
+
+    def fail(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        fix_text_file(path, strip_trailing=True)
+    assert path.read_bytes() == b"text  \n"
+    assert os.listdir(tmp_path) == ["notes.txt"]
+
+
+@pytest.mark.parametrize(
+    "name, content, expected",
+    [
+        ("notes.txt", b"one\ntwo", b"one\ntwo\n"),
+        ("build.bat", b"one\r\ntwo", b"one\r\ntwo\r\n"),
+        ("old.txt", b"one\rtwo", b"one\rtwo\n"),
+    ],
+)
+def test_final_newline_fix_follows_dominant_line_ending(
+    tmp_path, name, content, expected
+):
+    path = tmp_path / name
+    path.write_bytes(content)
+    issues = [i for i in TextQualityCheck().check(path) if i.issue_type == E_NO_NEWLINE]
+    assert len(issues) == 1
+
+    issues[0].fix()
+    assert path.read_bytes() == expected
+    assert E_NO_NEWLINE not in issue_types(path)